@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import math
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from truthweave.analysis.aggregate import (
+    AGGREGATIONS,
+    RunTable,
+    aggregation,
+    quantile_of,
+)
+
+_DIGIT_WORDS = "Zero One Two Three Four Five Six Seven Eight Nine".split()
+_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z_]*$")
+
+
+@dataclass
+class AggregationSpec:
+    name: str
+    metric: str
+    reduce: list[str]
+    experiment: str | None = None
+    where: dict[str, Any] = field(default_factory=dict)
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "metric": self.metric,
+            "reduce": self.reduce,
+            "experiment": self.experiment,
+            "where": self.where,
+        }
+
+
+def parse_specs(raw: Any) -> list[AggregationSpec]:
+    if not raw:
+        return []
+    if not isinstance(raw, list):
+        raise SystemExit("assets.aggregations must be a list")
+    specs = []
+    for item in raw:
+        if not isinstance(item, dict) or "name" not in item or "metric" not in item:
+            raise SystemExit(f"Aggregation needs 'name' and 'metric': {item}")
+        name = str(item["name"])
+        if not _NAME_RE.match(name):
+            raise SystemExit(f"Aggregation name must be letters/underscores: {name}")
+        reduce = item.get("reduce", ["mean"])
+        reduce = [reduce] if isinstance(reduce, str) else list(reduce)
+        for reducer in reduce:
+            if reducer not in AGGREGATIONS and quantile_of(reducer) is None:
+                raise SystemExit(f"Unknown reducer '{reducer}' in aggregation {name}")
+        where = item.get("where") or {}
+        if not isinstance(where, dict):
+            raise SystemExit(f"Aggregation {name}: 'where' must be a mapping")
+        specs.append(
+            AggregationSpec(
+                name=name,
+                metric=str(item["metric"]),
+                reduce=reduce,
+                experiment=item.get("experiment"),
+                where=where,
+            )
+        )
+    return specs
+
+
+def macro_name(spec_name: str, reducer: str) -> str:
+    q = quantile_of(reducer)
+    if q is not None:
+        suffix = "Q" + "".join(_DIGIT_WORDS[int(d)] for d in f"{round(q * 100):d}")
+    else:
+        suffix = reducer.capitalize()
+    parts = [p for p in spec_name.split("_") if p]
+    return "Agg" + "".join(p[0].upper() + p[1:] for p in parts) + suffix
+
+
+def _matches(cell: Any, expected: Any) -> bool:
+    if isinstance(expected, (int, float)) and not isinstance(expected, bool):
+        return cell == float(expected)
+    if isinstance(expected, (list, dict)):
+        return cell == json.dumps(expected, sort_keys=True)
+    return cell == str(expected)
+
+
+def select_rows(table: RunTable, spec: AggregationSpec) -> list[int]:
+    filters = dict(spec.where)
+    if spec.experiment is not None:
+        filters["experiment.name"] = spec.experiment
+    rows = list(range(table.n_rows))
+    for key, expected in filters.items():
+        column = table.column(f"config.{key}")
+        rows = [i for i in rows if _matches(column[i], expected)]
+    return rows
+
+
+def reduce_values(values: list[float], reducers: list[str]) -> dict[str, float]:
+    return {reducer: aggregation(reducer)(values) for reducer in reducers}
+
+
+def evaluate(
+    table: RunTable,
+    specs: list[AggregationSpec],
+    runs_dir: Path,
+    digest: Callable[[Path], str],
+    root: Path,
+) -> tuple[dict[str, float], list[dict[str, Any]]]:
+    run_ids = table.run_ids()
+    macros: dict[str, float] = {}
+    records = []
+    for spec in specs:
+        column = table.columns.get(f"metrics.{spec.metric}")
+        if column is None or isinstance(column, list):
+            raise SystemExit(
+                f"Aggregation {spec.name}: metric '{spec.metric}' is missing "
+                "or not numeric"
+            )
+        rows = [i for i in select_rows(table, spec) if not math.isnan(column[i])]
+        if not rows:
+            raise SystemExit(f"Aggregation {spec.name} selected no runs")
+        values = reduce_values([column[i] for i in rows], spec.reduce)
+        for reducer, value in values.items():
+            macros[macro_name(spec.name, reducer)] = value
+        contributing = sorted(run_ids[i] for i in rows)
+        records.append(
+            {
+                **spec.describe(),
+                "values": values,
+                "runs": [
+                    {
+                        "run_id": run_id,
+                        "metrics_json_path": str(path.relative_to(root)),
+                        "metrics_json_sha256": digest(path),
+                    }
+                    for run_id in contributing
+                    for path in [runs_dir / run_id / "metrics.json"]
+                ],
+            }
+        )
+    return macros, records
@@ -1,5 +1,346 @@
 from __future__ import annotations
 
+import argparse
+import importlib.util
+import json
+import math
+import os
+import statistics
+import struct
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable
 
-def aggregate() -> None:
-    pass
+from truthweave.utils import ensure_dir
+from truthweave.yaml_loader import load_yaml
+
+MAGIC = b"TWTABLE1"
+RUN_ID = "run_id"
+STAMP = "source_stamp"
+SOURCES = {
+    "metrics": "metrics.json",
+    "config": "config_resolved.yaml",
+    "seeds": "seeds.json",
+}
+AGGREGATIONS: dict[str, Callable[[list[float]], float]] = {
+    "count": lambda values: float(len(values)),
+    "mean": statistics.fmean,
+    "std": statistics.pstdev,
+    "min": min,
+    "max": max,
+    "sum": math.fsum,
+    "median": statistics.median,
+}
+
+
+def quantile_of(name: str) -> float | None:
+    if not name.startswith("quantile:"):
+        return None
+    try:
+        q = float(name.split(":", 1)[1])
+    except ValueError:
+        return None
+    return q if 0.0 <= q <= 1.0 else None
+
+
+def _quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    pos = q * (len(ordered) - 1)
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def aggregation(name: str) -> Callable[[list[float]], float]:
+    q = quantile_of(name)
+    if q is not None:
+        return partial(_quantile, q=q)
+    if name not in AGGREGATIONS:
+        raise SystemExit(f"Unknown aggregation '{name}'")
+    return AGGREGATIONS[name]
+
+
+def has_pyarrow() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def default_table_path(runs_dir: Path) -> Path:
+    suffix = ".parquet" if has_pyarrow() else ".twt"
+    return runs_dir.parent / "artifacts" / "manifests" / f"runs_table{suffix}"
+
+
+def _flatten(prefix: str, value: Any, out: dict[str, Any]) -> None:
+    if isinstance(value, dict):
+        for key, child in value.items():
+            _flatten(f"{prefix}.{key}", child, out)
+    elif isinstance(value, list):
+        out[prefix] = json.dumps(value, sort_keys=True)
+    else:
+        out[prefix] = value
+
+
+def source_stamp(run_dir: Path) -> str:
+    parts = []
+    for name in SOURCES.values():
+        try:
+            st = (run_dir / name).stat()
+        except FileNotFoundError:
+            parts.append("-")
+        else:
+            parts.append(f"{st.st_size}:{st.st_mtime_ns}")
+    return ";".join(parts)
+
+
+def read_run(run_dir: Path) -> dict[str, Any] | None:
+    if not (run_dir / SOURCES["metrics"]).exists():
+        return None
+    row: dict[str, Any] = {RUN_ID: run_dir.name, STAMP: source_stamp(run_dir)}
+    for prefix, name in SOURCES.items():
+        path = run_dir / name
+        if not path.exists():
+            continue
+        if path.suffix == ".json":
+            data = json.loads(path.read_text())
+        else:
+            data = load_yaml(path)
+        if isinstance(data, dict):
+            _flatten(prefix, data, row)
+    return row
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+@dataclass
+class RunTable:
+    columns: dict[str, Any] = field(default_factory=dict)
+    n_rows: int = 0
+
+    def column(self, name: str) -> list[Any]:
+        values = self.columns.get(name)
+        if values is None:
+            return [None] * self.n_rows
+        if isinstance(values, array):
+            return [None if math.isnan(v) else v for v in values]
+        return list(values)
+
+    def run_ids(self) -> list[str]:
+        return self.column(RUN_ID)
+
+    def append_rows(self, rows: Iterable[dict[str, Any]]) -> int:
+        added = 0
+        for row in rows:
+            for name, value in row.items():
+                if value is None:
+                    continue
+                if name not in self.columns:
+                    self.columns[name] = (
+                        array("d", [math.nan] * self.n_rows)
+                        if _is_number(value)
+                        else [None] * self.n_rows
+                    )
+                elif isinstance(self.columns[name], array) and not _is_number(value):
+                    self.columns[name] = [
+                        None if math.isnan(v) else _format_number(v)
+                        for v in self.columns[name]
+                    ]
+            for name, values in self.columns.items():
+                value = row.get(name)
+                if isinstance(values, array):
+                    values.append(math.nan if value is None else float(value))
+                else:
+                    values.append(None if value is None else str(value))
+            self.n_rows += 1
+            added += 1
+        return added
+
+    def drop_runs(self, run_ids: set[str]) -> int:
+        keep = [i for i, run_id in enumerate(self.run_ids()) if run_id not in run_ids]
+        dropped = self.n_rows - len(keep)
+        if dropped:
+            for name, values in self.columns.items():
+                kept = [values[i] for i in keep]
+                if isinstance(values, array):
+                    self.columns[name] = array("d", kept)
+                else:
+                    self.columns[name] = kept
+            self.n_rows = len(keep)
+        return dropped
+
+    def group_by(
+        self, keys: list[str], value: str, agg: str = "mean"
+    ) -> dict[tuple[Any, ...], float]:
+        func = aggregation(agg)
+        values = self.columns.get(value)
+        if not isinstance(values, array):
+            raise SystemExit(f"Column {value!r} is missing or not numeric")
+        groups: dict[tuple[Any, ...], list[float]] = {}
+        key_columns = [self.column(key) for key in keys]
+        for group, v in zip(zip(*key_columns), values):
+            if not math.isnan(v):
+                groups.setdefault(group, []).append(v)
+        return {group: func(vs) for group, vs in sorted(groups.items(), key=repr)}
+
+
+def _save_twt(table: RunTable, path: Path) -> None:
+    header: dict[str, Any] = {
+        "rows": table.n_rows,
+        "byteorder": sys.byteorder,
+        "columns": [],
+    }
+    blobs = []
+    for name, values in table.columns.items():
+        if isinstance(values, array):
+            header["columns"].append({"name": name, "kind": "f8"})
+            blobs.append(values.tobytes())
+        else:
+            dictionary: dict[str, int] = {}
+            codes = array(
+                "i",
+                [
+                    -1 if v is None else dictionary.setdefault(v, len(dictionary))
+                    for v in values
+                ],
+            )
+            header["columns"].append(
+                {"name": name, "kind": "dict", "values": list(dictionary)}
+            )
+            blobs.append(codes.tobytes())
+    header_bytes = json.dumps(header).encode()
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+
+
+def _load_twt(path: Path) -> RunTable:
+    data = memoryview(path.read_bytes())
+    if bytes(data[: len(MAGIC)]) != MAGIC:
+        raise SystemExit(f"Not a run table: {path}")
+    offset = len(MAGIC) + 8
+    (header_len,) = struct.unpack("<Q", data[len(MAGIC) : offset])
+    header = json.loads(bytes(data[offset : offset + header_len]))
+    offset += header_len
+    n_rows = header["rows"]
+    swap = header["byteorder"] != sys.byteorder
+    table = RunTable(n_rows=n_rows)
+    for column in header["columns"]:
+        values = array("d" if column["kind"] == "f8" else "i")
+        size = values.itemsize * n_rows
+        values.frombytes(data[offset : offset + size])
+        offset += size
+        if swap:
+            values.byteswap()
+        if column["kind"] == "f8":
+            table.columns[column["name"]] = values
+        else:
+            lookup = column["values"]
+            table.columns[column["name"]] = [
+                None if code < 0 else lookup[code] for code in values
+            ]
+    return table
+
+
+def _save_parquet(table: RunTable, path: Path) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    pq.write_table(
+        pa.table({name: table.column(name) for name in table.columns}), tmp_path
+    )
+    os.replace(tmp_path, path)
+
+
+def _load_parquet(path: Path) -> RunTable:
+    import pyarrow.parquet as pq
+
+    data = pq.read_table(path).to_pydict()
+    table = RunTable()
+    for name, values in data.items():
+        table.n_rows = len(values)
+        if all(v is None or _is_number(v) for v in values):
+            table.columns[name] = array(
+                "d", [math.nan if v is None else float(v) for v in values]
+            )
+        else:
+            table.columns[name] = values
+    return table
+
+
+def load_table(path: Path) -> RunTable:
+    if not path.exists():
+        return RunTable()
+    if path.suffix == ".parquet":
+        return _load_parquet(path)
+    return _load_twt(path)
+
+
+def save_table(table: RunTable, path: Path) -> None:
+    ensure_dir(path.parent)
+    if path.suffix == ".parquet":
+        _save_parquet(table, path)
+    else:
+        _save_twt(table, path)
+
+
+def aggregate(
+    runs_dir: Path, table_path: Path | None = None, rebuild: bool = False
+) -> tuple[RunTable, int, int]:
+    if table_path is None:
+        table_path = default_table_path(runs_dir)
+    table = RunTable() if rebuild else load_table(table_path)
+    present: dict[str, Path] = {}
+    if runs_dir.exists():
+        with os.scandir(runs_dir) as it:
+            present = {entry.name: Path(entry.path) for entry in it if entry.is_dir()}
+    known = dict(zip(table.run_ids(), table.column(STAMP)))
+    stale = {
+        name
+        for name, stamp in known.items()
+        if name in present and stamp != source_stamp(present[name])
+    }
+    dropped = table.drop_runs((set(known) - set(present)) | stale)
+    new_runs = sorted(name for name in present if name not in known or name in stale)
+    rows = (read_run(present[name]) for name in new_runs)
+    added = table.append_rows(row for row in rows if row is not None)
+    if added or dropped or not table_path.exists():
+        save_table(table, table_path)
+    return table, added, dropped
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Fold all runs into one columnar table"
+    )
+    parser.add_argument("--runs_dir", default="runs")
+    parser.add_argument("--out", help="Table path (.parquet or .twt)")
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args(argv)
+
+    runs_dir = Path(args.runs_dir)
+    table_path = Path(args.out) if args.out else default_table_path(runs_dir)
+    start = time.perf_counter()
+    table, added, dropped = aggregate(runs_dir, table_path, args.rebuild)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Aggregated {table.n_rows} runs ({added} added, {dropped} removed) "
+        f"into {table_path} in {elapsed:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+from truthweave.arrays import ARRAY_SUFFIX, SIDECAR_SUFFIX, array_path, sidecar_path
+
+
+@dataclass
+class ArrayRef:
+    path: Path
+    shape: tuple[int, ...]
+    dtype: str
+    meta: dict[str, Any] = field(default_factory=dict)
+    _data: Any = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def open(cls, path: Path) -> "ArrayRef":
+        sidecar = sidecar_path(path)
+        if not sidecar.exists():
+            raise FileNotFoundError(f"Missing sidecar {sidecar.name} for {path}")
+        info = json.loads(sidecar.read_text())
+        return cls(
+            path=path,
+            shape=tuple(info["shape"]),
+            dtype=info["dtype"],
+            meta=info.get("meta") or {},
+        )
+
+    @property
+    def data(self) -> Any:
+        if self._data is None:
+            import numpy as np
+
+            self._data = np.load(self.path, mmap_mode="r", allow_pickle=False)
+        return self._data
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.data[key]
+
+    def __len__(self) -> int:
+        return self.shape[0] if self.shape else 1
+
+    def iter_chunks(self, rows: int = 65536) -> Iterator[Any]:
+        for start in range(0, len(self), rows):
+            yield self.data[start : start + rows]
+
+    def close(self) -> None:
+        self._data = None
+
+
+def load_array(path: Path) -> ArrayRef:
+    return ArrayRef.open(path)
+
+
+def run_arrays(run_dir: Path) -> dict[str, ArrayRef]:
+    artifacts_dir = run_dir / "artifacts"
+    arrays = {}
+    for dirpath, dirnames, filenames in os.walk(artifacts_dir):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if not name.endswith(SIDECAR_SUFFIX):
+                continue
+            path = Path(dirpath) / name[: -len(".json")]
+            if path.exists():
+                rel = path.relative_to(artifacts_dir).as_posix()
+                arrays[rel[: -len(ARRAY_SUFFIX)]] = ArrayRef.open(path)
+    return arrays
+
+
+def iter_run_arrays(runs_dir: Path, name: str) -> Iterator[tuple[str, ArrayRef]]:
+    if not runs_dir.exists():
+        return
+    with os.scandir(runs_dir) as it:
+        run_ids = sorted(entry.name for entry in it if entry.is_dir())
+    for run_id in run_ids:
+        path = array_path(runs_dir / run_id / "artifacts", name)
+        if path.exists():
+            yield run_id, ArrayRef.open(path)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from truthweave.utils import ensure_dir, write_json
+
+ARRAY_SUFFIX = ".npy"
+SIDECAR_SUFFIX = ".npy.json"
+
+
+def array_path(directory: Path, name: str) -> Path:
+    return directory / f"{name}{ARRAY_SUFFIX}"
+
+
+def sidecar_path(path: Path) -> Path:
+    return path.with_name(path.name + ".json")
+
+
+def save_array(path: Path, array: Any, **meta: Any) -> dict[str, Any]:
+    import numpy as np
+
+    data = np.ascontiguousarray(array)
+    if data.dtype.hasobject:
+        raise ValueError(f"Cannot store object arrays as {ARRAY_SUFFIX}: {path}")
+    ensure_dir(path.parent)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as f:
+        np.save(f, data, allow_pickle=False)
+    os.replace(tmp_path, path)
+    info = {
+        "shape": list(data.shape),
+        "dtype": data.dtype.str,
+        "nbytes": int(data.nbytes),
+        "meta": json.loads(json.dumps(meta, default=str)),
+    }
+    write_json(sidecar_path(path), info)
+    return info
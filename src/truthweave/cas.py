@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+import shutil
+import stat
+import time
+from pathlib import Path
+from typing import Any
+
+from omegaconf import OmegaConf
+
+from truthweave.hashcache import CACHE_MIN_BYTES, HashCache, digest_file
+from truthweave.utils import ensure_dir, link_or_copy
+
+READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+_RETRIES = 3
+
+
+def default_store_root(repo_root: Path) -> Path:
+    return repo_root / "artifacts" / "cas"
+
+
+def _same_file(a: os.stat_result, b: os.stat_result) -> bool:
+    return (a.st_ino, a.st_dev) == (b.st_ino, b.st_dev)
+
+
+class BlobStore:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def _tmp_path(self, path: Path) -> Path:
+        return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    def put(
+        self, src: Path, cache: HashCache | None = None, in_place: bool = False
+    ) -> str:
+        digest = digest_file(src, src.stat().st_size, cache)
+        blob = self.blob_path(digest)
+        try:
+            if digest_file(blob, blob.stat().st_size, cache) == digest:
+                os.chmod(blob, READ_ONLY)
+                return digest
+        except FileNotFoundError:
+            pass
+        ensure_dir(blob.parent)
+        tmp = self._tmp_path(blob)
+        if in_place:
+            link_or_copy(src, tmp)
+        else:
+            shutil.copyfile(src, tmp)
+        os.chmod(tmp, READ_ONLY)
+        os.replace(tmp, blob)
+        return digest
+
+    def link(self, digest: str, dst: Path, cache: HashCache | None = None) -> None:
+        blob_st = self.blob_path(digest).stat()
+        try:
+            if _same_file(dst.stat(), blob_st):
+                return
+        except FileNotFoundError:
+            ensure_dir(dst.parent)
+        tmp = self._tmp_path(dst)
+        link_or_copy(self.blob_path(digest), tmp)
+        os.replace(tmp, dst)
+        if cache is not None and blob_st.st_size >= CACHE_MIN_BYTES:
+            cache.remember(dst, digest)
+
+    def store(
+        self,
+        src: Path,
+        dst: Path,
+        cache: HashCache | None = None,
+        in_place: bool = False,
+    ) -> str:
+        for attempt in range(_RETRIES):
+            digest = self.put(src, cache, in_place)
+            try:
+                self.link(digest, dst, cache)
+                return digest
+            except FileNotFoundError:
+                if attempt == _RETRIES - 1:
+                    raise
+        return digest
+
+    def adopt(self, path: Path, cache: HashCache | None = None) -> str:
+        return self.store(path, path, cache, in_place=True)
+
+    def absorb(self, directory: Path, cache: HashCache | None = None) -> int:
+        count = 0
+        for dirpath, _, filenames in os.walk(directory):
+            for name in filenames:
+                path = Path(dirpath) / name
+                if not path.is_symlink() and not name.endswith(".tmp"):
+                    self.adopt(path, cache)
+                    count += 1
+        return count
+
+    def gc(
+        self, grace_seconds: float = 3600.0, dry_run: bool = False
+    ) -> dict[str, int]:
+        stats = {"removed": 0, "freed_bytes": 0, "kept": 0}
+        if not self.root.exists():
+            return stats
+        cutoff = time.time() - grace_seconds
+        for shard in self.root.iterdir():
+            if not shard.is_dir():
+                continue
+            for blob in shard.iterdir():
+                st = blob.lstat()
+                if st.st_nlink > 1 or st.st_ctime > cutoff:
+                    stats["kept"] += 1
+                    continue
+                if not dry_run:
+                    blob.unlink()
+                stats["removed"] += 1
+                stats["freed_bytes"] += st.st_size
+        return stats
+
+
+def blob_store_for(repo_root: Path, cfg: Any) -> BlobStore | None:
+    if not OmegaConf.select(cfg, "cache.cas", default=True):
+        return None
+    return BlobStore(default_store_root(repo_root))
@@ -1,21 +1,121 @@
 from __future__ import annotations
 
+import mmap
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Iterable
 
 from truthweave.checks.models import Issue
 
+ALLOW_MARKER = b"truthweave-allow-number"
+_PATTERN = re.compile(
+    rb"(?P<number>\b\d+\.\d+\b|\b\d+%)"
+    rb"|\\(?:input|include)\s*\{(?P<target>[^}\n]+)\}"
+)
+
+
+def _scan_file(path: Path) -> tuple[list[tuple[int, str]], list[str]]:
+    violations: list[tuple[int, str]] = []
+    includes: list[str] = []
+    with path.open("rb") as f:
+        if path.stat().st_size == 0:
+            return violations, includes
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            line_no = 1
+            last = 0
+            reported_line = 0
+            for match in _PATTERN.finditer(buf):
+                start = match.start()
+                line_no += buf[last:start].count(b"\n")
+                last = start
+                line_start = buf.rfind(b"\n", 0, start) + 1
+                line_end = buf.find(b"\n", start)
+                line = buf[line_start : len(buf) if line_end < 0 else line_end]
+                comment_at = line.find(b"%")
+                if comment_at >= 0 and match.end() - line_start > comment_at:
+                    continue
+                if match.group("target") is not None:
+                    includes.append(match.group("target").decode().strip())
+                    continue
+                if ALLOW_MARKER in line or reported_line == line_no:
+                    continue
+                reported_line = line_no
+                text = line.decode("utf-8", errors="replace").strip()
+                violations.append((line_no, text))
+    return violations, includes
+
+
+def _resolve_include(base_dir: Path, target: str) -> Path:
+    path = base_dir / target
+    if not path.suffix:
+        path = path.with_suffix(".tex")
+    return path
+
+
+def scan(
+    tex_path: Path, skip_dirs: Iterable[Path] = (), jobs: int = 8
+) -> list[tuple[Path, int, str]]:
+    base_dir = tex_path.parent
+    skipped = [d.resolve() for d in skip_dirs]
+    root = tex_path.resolve()
+    scanned: dict[Path, tuple[Path, list[tuple[int, str]]]] = {}
+    children: dict[Path, list[Path]] = {}
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending = {pool.submit(_scan_file, tex_path): (root, tex_path)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                resolved, path = pending.pop(future)
+                violations, includes = future.result()
+                scanned[resolved] = (path, violations)
+                children[resolved] = []
+                for target in includes:
+                    child = _resolve_include(base_dir, target)
+                    child_resolved = child.resolve()
+                    if not child.is_file() or any(
+                        d == child_resolved or d in child_resolved.parents
+                        for d in skipped
+                    ):
+                        continue
+                    children[resolved].append(child_resolved)
+                    if child_resolved in scanned:
+                        continue
+                    scanned[child_resolved] = (child, [])
+                    pending[pool.submit(_scan_file, child)] = (child_resolved, child)
+
+    found: list[tuple[Path, int, str]] = []
+    seen: set[Path] = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node in seen:
+            continue
+        seen.add(node)
+        path, violations = scanned[node]
+        found.extend((path, line, text) for line, text in violations)
+        stack.extend(reversed(children[node]))
+    return found
+
+
+def check(
+    tex_path: Path,
+    mode: str,
+    paper_id: str | None,
+    skip_dirs: Iterable[Path] | None = None,
+) -> list[Issue]:
+    recheck = f"uv run truthweave check --mode {mode}"
+    if paper_id:
+        recheck += f" --paper {paper_id}"
+    severity = "FAIL" if mode == "ci" else "WARN"
 
-def check(tex_path: Path, mode: str, paper_id: str | None) -> list[Issue]:
     if not tex_path.exists():
         fix = "Create the paper main.tex or run paperops create-paper <paper_id>."
-        recheck = f"uv run truthweave check --mode {mode}"
-        if paper_id:
-            recheck += f" --paper {paper_id}"
         return [
             Issue(
                 category="PAPER_NUMBERS",
-                severity="FAIL" if mode == "ci" else "WARN",
+                severity=severity,
                 message=f"Missing tex file: {tex_path}",
                 fix=fix,
                 recheck=recheck,
@@ -23,33 +123,20 @@ def check(tex_path: Path, mode: str, paper_id: str | None) -> list[Issue]:
             )
         ]
 
-    decimal_pattern = re.compile(r"\b\d+\.\d+\b")
-    percent_pattern = re.compile(r"\b\d+%")
-
-    violations = []
-    for idx, raw_line in enumerate(tex_path.read_text().splitlines(), start=1):
-        if "truthweave-allow-number" in raw_line:
-            continue
-        line = raw_line.split("%", 1)[0]
-        if decimal_pattern.search(line) or percent_pattern.search(line):
-            violations.append(f"line {idx}: {raw_line.strip()}")
-
-    if violations:
-        fix = (
-            "Replace inline numbers with TeX macros from auto/variables.tex or "
-            "append `% truthweave-allow-number` to allowlist."
+    if skip_dirs is None:
+        skip_dirs = [tex_path.parent / "auto"]
+    fix = (
+        "Replace inline numbers with TeX macros from auto/variables.tex or "
+        "append `% truthweave-allow-number` to allowlist."
+    )
+    return [
+        Issue(
+            category="PAPER_NUMBERS",
+            severity=severity,
+            message=f"Manual number detected in {path}:{line}: {text}",
+            fix=fix,
+            recheck=recheck,
+            paths=[f"{path}:{line}"],
         )
-        recheck = f"uv run truthweave check --mode {mode}"
-        if paper_id:
-            recheck += f" --paper {paper_id}"
-        return [
-            Issue(
-                category="PAPER_NUMBERS",
-                severity="FAIL" if mode == "ci" else "WARN",
-                message=f"Manual numbers detected in {tex_path}",
-                fix=fix,
-                recheck=recheck,
-                paths=[str(tex_path)],
-            )
-        ]
-    return []
+        for path, line, text in scan(tex_path, skip_dirs)
+    ]
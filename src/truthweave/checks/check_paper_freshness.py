@@ -1,18 +1,36 @@
 from __future__ import annotations
 
 import json
+from functools import partial
 from pathlib import Path
 
+from truthweave.checks.context import CheckContext
 from truthweave.checks.models import Issue
+from truthweave.hashcache import hash_cache_for
 from truthweave.papers import load_paper_config
 from truthweave.utils import sha256_file
 
 
-def check(repo_root: Path, paper_dir: Path, paper_id: str, mode: str) -> list[Issue]:
-    config = load_paper_config(paper_dir / "truthweave.yml")
-    auto_dir = paper_dir / config["paths"]["auto_dir"]
-    manifest_path = auto_dir / "MANIFEST.json"
-    if not manifest_path.exists():
+def check(
+    repo_root: Path,
+    paper_dir: Path,
+    paper_id: str,
+    mode: str,
+    context: CheckContext | None = None,
+) -> list[Issue]:
+    if context is not None:
+        manifest_path = context.manifest_path(paper_id)
+        manifest = context.manifest(paper_id)
+        digest = context.sha256
+    else:
+        config = load_paper_config(paper_dir / "truthweave.yml")
+        auto_dir = paper_dir / config.paths["auto_dir"]
+        manifest_path = auto_dir / "MANIFEST.json"
+        manifest = (
+            json.loads(manifest_path.read_text()) if manifest_path.exists() else None
+        )
+        digest = partial(sha256_file, cache=hash_cache_for(repo_root))
+    if manifest is None:
         fix = f"uv run truthweave build-paper-assets --paper {paper_id}"
         recheck = f"uv run truthweave check --paper {paper_id} --mode {mode}"
         return [
@@ -29,7 +47,6 @@ def check(repo_root: Path, paper_dir: Path, paper_id: str, mode: str) -> list[Is
             )
         ]
 
-    manifest = json.loads(manifest_path.read_text())
     metrics_path = repo_root / manifest["source"]["metrics_json_path"]
     if not metrics_path.exists():
         fix = "uv run truthweave run exp=example"
@@ -44,9 +61,16 @@ def check(repo_root: Path, paper_dir: Path, paper_id: str, mode: str) -> list[Is
                 paths=[str(metrics_path)],
             )
         ]
-    expected = manifest["source"]["metrics_json_sha256"]
-    actual = sha256_file(metrics_path)
-    if actual != expected:
+    stale = []
+    if digest(metrics_path) != manifest["source"]["metrics_json_sha256"]:
+        stale.append(metrics_path)
+    for record in manifest["source"].get("aggregations", []):
+        for run in record["runs"]:
+            rel = run.get("metrics_json_path", f"runs/{run['run_id']}/metrics.json")
+            path = repo_root / rel
+            if not path.exists() or digest(path) != run["metrics_json_sha256"]:
+                stale.append(path)
+    if stale:
         fix = f"uv run truthweave build-paper-assets --paper {paper_id}"
         recheck = f"uv run truthweave check --paper {paper_id} --mode {mode}"
         return [
@@ -56,7 +80,7 @@ def check(repo_root: Path, paper_dir: Path, paper_id: str, mode: str) -> list[Is
                 message=f"Paper assets are stale for {paper_id}; run build-paper-assets.",
                 fix=fix,
                 recheck=recheck,
-                paths=[str(manifest_path), str(metrics_path)],
+                paths=[str(manifest_path), *map(str, dict.fromkeys(stale))],
             )
         ]
     return []
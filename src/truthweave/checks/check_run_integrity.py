@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
 
 from truthweave.checks.models import Issue
+from truthweave.run_manifest import RUN_MANIFEST, verify_run
 from truthweave.utils import find_latest_run
 
+if TYPE_CHECKING:
+    from truthweave.hashcache import HashCache
+
 
 REQUIRED_FILES = [
     "config_resolved.yaml",
@@ -20,22 +25,19 @@ REQUIRED_DIRS = [
 ]
 
 
-def check(runs_dir: Path, mode: str, paper_id: str | None = None) -> list[Issue]:
-    run_dir = find_latest_run(runs_dir)
-    if run_dir is None:
-        fix = "uv run truthweave run exp=example"
-        recheck = (
-            f"uv run truthweave check --mode {mode}"
-            + (f" --paper {paper_id}" if paper_id else "")
-        )
+def _check_run(
+    run_dir: Path, recheck: str, cache: HashCache | None
+) -> list[Issue]:
+    fix = "uv run truthweave run exp=example"
+    if not run_dir.is_dir():
         return [
             Issue(
                 category="RUN_INTEGRITY",
                 severity="FAIL",
-                message="No runs found to check.",
-                fix=fix,
+                message=f"Pinned run not found: {run_dir}",
+                fix="Update inputs.metrics_source in truthweave.yml",
                 recheck=recheck,
-                paths=[str(runs_dir)],
+                paths=[str(run_dir)],
             )
         ]
 
@@ -44,11 +46,6 @@ def check(runs_dir: Path, mode: str, paper_id: str | None = None) -> list[Issue]
         name for name in REQUIRED_DIRS if not (run_dir / name).is_dir()
     ]
     if missing:
-        fix = "uv run truthweave run exp=example"
-        recheck = (
-            f"uv run truthweave check --mode {mode}"
-            + (f" --paper {paper_id}" if paper_id else "")
-        )
         return [
             Issue(
                 category="RUN_INTEGRITY",
@@ -59,4 +56,54 @@ def check(runs_dir: Path, mode: str, paper_id: str | None = None) -> list[Issue]
                 paths=[str(run_dir / name) for name in missing],
             )
         ]
+
+    result = verify_run(run_dir, cache)
+    if result.problems:
+        return [
+            Issue(
+                category="RUN_INTEGRITY",
+                severity="FAIL",
+                message=(
+                    f"Run {run_dir} does not match {RUN_MANIFEST}: "
+                    + "; ".join(result.problems)
+                ),
+                fix=f"Re-run the experiment or restore {run_dir} from backup",
+                recheck=recheck,
+                paths=[str(run_dir / RUN_MANIFEST)],
+            )
+        ]
     return []
+
+
+def check(
+    runs_dir: Path,
+    mode: str,
+    paper_id: str | None = None,
+    pinned: Iterable[str] = (),
+    cache: HashCache | None = None,
+) -> list[Issue]:
+    recheck = (
+        f"uv run truthweave check --mode {mode}"
+        + (f" --paper {paper_id}" if paper_id else "")
+    )
+    run_dir = find_latest_run(runs_dir)
+    if run_dir is None:
+        fix = "uv run truthweave run exp=example"
+        return [
+            Issue(
+                category="RUN_INTEGRITY",
+                severity="FAIL",
+                message="No runs found to check.",
+                fix=fix,
+                recheck=recheck,
+                paths=[str(runs_dir)],
+            )
+        ]
+
+    run_dirs = [run_dir]
+    for run_id in sorted(set(pinned)):
+        if run_id != "latest" and runs_dir / run_id != run_dir:
+            run_dirs.append(runs_dir / run_id)
+    return [
+        issue for path in run_dirs for issue in _check_run(path, recheck, cache)
+    ]
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import os
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any
 
-from omegaconf import OmegaConf
-
 from truthweave.checks.models import Issue
+from truthweave.yaml_loader import load_yaml
 
 
 def _default_contract() -> dict[str, Any]:
@@ -36,15 +37,66 @@ def _default_contract() -> dict[str, Any]:
         "rules": {
             "require_paperops_yml": True,
             "allow_hidden": True,
+            "scan_skip_dirs": [
+                "node_modules",
+                "__pycache__",
+                "*.egg-info",
+                "/runs/*/artifacts",
+                "/data/raw",
+                "/data/processed",
+                "/artifacts/cas",
+                "/artifacts/cache",
+            ],
+            "scan_max_depth": 8,
         },
     }
 
 
+def _is_skipped(rel: str, name: str, patterns: list[str]) -> bool:
+    for pattern in patterns:
+        if "/" in pattern:
+            if fnmatch(rel, pattern.lstrip("/")):
+                return True
+        elif fnmatch(name, pattern):
+            return True
+    return False
+
+
+def _find_dirs(
+    repo_root: Path,
+    names: set[str],
+    skip_patterns: list[str],
+    max_depth: int,
+) -> list[str]:
+    found: list[str] = []
+    stack: list[tuple[str, str, int]] = [(str(repo_root), "", 1)]
+    while stack:
+        path, rel_dir, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in reversed(entries):
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            name = entry.name
+            if name.startswith("."):
+                continue
+            rel = f"{rel_dir}/{name}" if rel_dir else name
+            if name in names:
+                found.append(rel)
+            if depth >= max_depth or _is_skipped(rel, name, skip_patterns):
+                continue
+            stack.append((entry.path, rel, depth + 1))
+    return found
+
+
 def _load_contract(repo_root: Path) -> dict[str, Any]:
     path = repo_root / "conf" / "repo_contract.yml"
     if not path.exists():
         return _default_contract()
-    data = OmegaConf.to_container(OmegaConf.load(path), resolve=True)
+    data = load_yaml(path)
     if not isinstance(data, dict):
         return _default_contract()
     merged = _default_contract()
@@ -88,19 +140,19 @@ def check(repo_root: Path, mode: str) -> list[Issue]:
                 continue
             errors.append(f"Unexpected src package dir: src/{entry.name}")
 
-    experiments_dir = repo_root / "src" / "truthweave" / "experiments"
-    for entry in repo_root.rglob("experiments"):
-        if any(part.startswith(".") for part in entry.parts):
-            continue
-        if entry.is_dir() and entry.resolve() != experiments_dir.resolve():
-            errors.append(f"Unexpected experiments dir: {entry.relative_to(repo_root)}")
-
-    analysis_dir = repo_root / "src" / "truthweave" / "analysis"
-    for entry in repo_root.rglob("analysis"):
-        if any(part.startswith(".") for part in entry.parts):
-            continue
-        if entry.is_dir() and entry.resolve() != analysis_dir.resolve():
-            errors.append(f"Unexpected analysis dir: {entry.relative_to(repo_root)}")
+    expected = {
+        "experiments": "src/truthweave/experiments",
+        "analysis": "src/truthweave/analysis",
+    }
+    for rel in _find_dirs(
+        repo_root,
+        set(expected),
+        list(rules.get("scan_skip_dirs", [])),
+        int(rules.get("scan_max_depth", 8)),
+    ):
+        name = rel.rsplit("/", 1)[-1]
+        if rel != expected[name]:
+            errors.append(f"Unexpected {name} dir: {rel}")
 
     data_dir = repo_root / "data"
     if data_dir.exists():
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from truthweave.hashcache import hash_cache_for
+from truthweave.papers import PaperConfig, discover_paper_configs
+from truthweave.utils import sha256_file
+
+
+@dataclass
+class CheckContext:
+    repo_root: Path
+    mode: str
+    discovery: dict[str, Any]
+    papers: dict[str, dict[str, Any]]
+    configs: dict[str, PaperConfig]
+    _manifests: dict[str, dict[str, Any] | None] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls, repo_root: Path, mode: str, paper_id: str | None = None
+    ) -> "CheckContext":
+        discovery, all_configs = discover_paper_configs(repo_root)
+        papers = {paper["paper_id"]: paper for paper in discovery["papers"]}
+        if paper_id is not None:
+            if paper_id not in papers:
+                raise SystemExit(
+                    f"Unknown paper_id '{paper_id}'. Run truthweave discover."
+                )
+            papers = {paper_id: papers[paper_id]}
+        configs = {pid: all_configs[pid] for pid in papers}
+        return cls(
+            repo_root=repo_root,
+            mode=mode,
+            discovery=discovery,
+            papers=papers,
+            configs=configs,
+        )
+
+    def paper_dir(self, paper_id: str) -> Path:
+        return self.repo_root / self.papers[paper_id]["path"]
+
+    def tex_path(self, paper_id: str) -> Path:
+        return self.paper_dir(paper_id) / self.configs[paper_id].main
+
+    def auto_dir(self, paper_id: str) -> Path:
+        return self.paper_dir(paper_id) / self.configs[paper_id].paths["auto_dir"]
+
+    def manifest_path(self, paper_id: str) -> Path:
+        return self.auto_dir(paper_id) / "MANIFEST.json"
+
+    def manifest(self, paper_id: str) -> dict[str, Any] | None:
+        if paper_id not in self._manifests:
+            path = self.manifest_path(paper_id)
+            self._manifests[paper_id] = (
+                json.loads(path.read_text()) if path.exists() else None
+            )
+        return self._manifests[paper_id]
+
+    def sha256(self, path: Path) -> str:
+        return sha256_file(path, hash_cache_for(self.repo_root))
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from truthweave.checks.models import Issue
+
+
+@dataclass
+class CheckTask:
+    name: str
+    fn: Callable[[], List[Issue]]
+    timeout: Optional[float] = None
+
+
+@dataclass
+class CheckResult:
+    name: str
+    issues: List[Issue] = field(default_factory=list)
+    elapsed: float = 0.0
+    timed_out: bool = False
+    error: Optional[BaseException] = None
+
+
+def _timeout_issue(task: CheckTask, recheck: str) -> Issue:
+    return Issue(
+        category="CHECK_TIMEOUT",
+        severity="FAIL",
+        message=f"Check {task.name} did not finish within {task.timeout:g}s",
+        fix=(
+            "Investigate the slow check or raise checks.timeout_seconds / "
+            "checks.timeouts in conf/pipeline.yaml."
+        ),
+        recheck=recheck,
+        paths=[],
+    )
+
+
+def run_checks(
+    tasks: list[CheckTask], jobs: int | None = None, recheck: str = ""
+) -> list[CheckResult]:
+    jobs = max(1, jobs or os.cpu_count() or 1)
+    results: list[CheckResult | None] = [None] * len(tasks)
+    finished = threading.Condition()
+    running: dict[int, float] = {}
+    pending = list(range(len(tasks)))
+
+    def worker(idx: int) -> None:
+        task = tasks[idx]
+        start = time.perf_counter()
+        result = CheckResult(name=task.name)
+        try:
+            result.issues = list(task.fn())
+        except BaseException as exc:  # re-raised in the caller's thread
+            result.error = exc
+        result.elapsed = time.perf_counter() - start
+        with finished:
+            if results[idx] is None:
+                results[idx] = result
+            running.pop(idx, None)
+            finished.notify()
+
+    with finished:
+        while pending or running:
+            while pending and len(running) < jobs:
+                idx = pending.pop(0)
+                running[idx] = time.perf_counter()
+                threading.Thread(target=worker, args=(idx,), daemon=True).start()
+
+            now = time.perf_counter()
+            wait_for: float | None = None
+            for idx, started in list(running.items()):
+                timeout = tasks[idx].timeout
+                if timeout is None:
+                    continue
+                remaining = started + timeout - now
+                if remaining <= 0:
+                    running.pop(idx)
+                    results[idx] = CheckResult(
+                        name=tasks[idx].name,
+                        issues=[_timeout_issue(tasks[idx], recheck)],
+                        elapsed=now - started,
+                        timed_out=True,
+                    )
+                elif wait_for is None or remaining < wait_for:
+                    wait_for = remaining
+            if running and not (pending and len(running) < jobs):
+                finished.wait(timeout=wait_for)
+
+    ordered = [result for result in results if result is not None]
+    for result in ordered:
+        if result.error is not None:
+            raise result.error
+    return ordered
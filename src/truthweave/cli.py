@@ -1,28 +1,39 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import shutil
 import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any
-
-import hydra
-from omegaconf import OmegaConf
-
-from truthweave.checks import (
-    check_no_manual_numbers,
-    check_paper_freshness,
-    check_run_integrity,
-    check_structure,
+from typing import TYPE_CHECKING, Any, Callable
+
+from truthweave import __version__, daemon
+from truthweave.hashcache import HashCache, hash_cache_for
+from truthweave.papers import (
+    PaperConfig,
+    discover_paper_configs,
+    discover_papers,
+    get_paper_by_id,
+    load_paper_config,
+    write_discovery_manifest,
+)
+from truthweave.utils import (
+    ensure_dir,
+    find_latest_run,
+    sha256_file,
+    write_text_atomic,
 )
-from truthweave.checks.models import Issue
-from truthweave.papers import get_paper_by_id, load_paper_config, write_discovery_manifest
-from truthweave.registry import get_experiment_class
-from truthweave.runner import ExperimentRunner
-from truthweave.utils import ensure_dir, find_latest_run, sha256_file, write_json
+from truthweave.yaml_loader import load_yaml
+
+if TYPE_CHECKING:
+    from truthweave.checks.models import Issue
 
 
 def _repo_root() -> Path:
@@ -32,14 +43,19 @@ def _repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+def _hashes() -> HashCache:
+    return hash_cache_for(_repo_root())
+
+
 def _load_config(overrides: list[str]) -> Any:
-    config_dir = _repo_root() / "conf"
-    with hydra.initialize_config_dir(config_dir=str(config_dir), version_base=None):
-        cfg = hydra.compose(config_name="base", overrides=overrides)
-    return cfg
+    from truthweave.compose import compose_many
+
+    return compose_many(_repo_root() / "conf", [overrides])[0]
 
 
 def _resolve_run_dir(cfg: Any) -> Path:
+    from omegaconf import OmegaConf
+
     runs_dir = _repo_root() / cfg.project.runs_dir
     run_subdir = OmegaConf.to_container(cfg, resolve=True)["experiment"][
         "output_subdir"
@@ -62,17 +78,20 @@ def _load_pipeline_config(repo_root: Path) -> dict[str, Any]:
     pipeline_path = repo_root / "conf" / "pipeline.yaml"
     if not pipeline_path.exists():
         return {}
-    cfg = OmegaConf.load(pipeline_path)
-    data = OmegaConf.to_container(cfg, resolve=True)
+    data = load_yaml(pipeline_path)
     if not isinstance(data, dict):
         return {}
     return data
 
 
-def _resolve_metrics_source(repo_root: Path, metrics_source: str | None) -> Path:
+def _latest_runs_dir(repo_root: Path) -> Path:
     pipeline = _load_pipeline_config(repo_root)
     latest_cfg = pipeline.get("latest", {}) if isinstance(pipeline, dict) else {}
-    runs_dir = repo_root / latest_cfg.get("runs_dir", "runs")
+    return repo_root / latest_cfg.get("runs_dir", "runs")
+
+
+def _resolve_metrics_source(repo_root: Path, metrics_source: str | None) -> Path:
+    runs_dir = _latest_runs_dir(repo_root)
 
     if metrics_source in (None, "latest"):
         run_dir = find_latest_run(runs_dir)
@@ -86,64 +105,265 @@ def _resolve_metrics_source(repo_root: Path, metrics_source: str | None) -> Path
     return run_dir
 
 
-def _build_paper_assets(paper_id: str) -> None:
-    repo_root = _repo_root()
-    paper = get_paper_by_id(repo_root, paper_id)
-    paper_dir = repo_root / paper["path"]
-    config = load_paper_config(paper_dir / "truthweave.yml")
-    inputs = config.get("inputs", {})
-    metrics_source = inputs.get("metrics_source")
-
-    run_dir = _resolve_metrics_source(repo_root, metrics_source)
-    metrics_path = run_dir / "metrics.json"
-    if not metrics_path.exists():
-        raise SystemExit(f"Missing metrics.json in {run_dir}")
-
-    metrics = json.loads(metrics_path.read_text())
-
-    auto_dir = paper_dir / config["paths"]["auto_dir"]
-    ensure_dir(auto_dir)
-    variables_path = auto_dir / "variables.tex"
-
+def _render_variables(
+    metrics: dict[str, Any], aggregated: dict[str, float] | None = None
+) -> str:
     lines = []
     for key, value in metrics.items():
         macro = _metric_macro_name(key)
         formatted = _format_metric_value(value)
         lines.append(f"\\newcommand{{\\{macro}}}{{{formatted}}}")
+    for macro, value in (aggregated or {}).items():
+        formatted = _format_metric_value(value)
+        lines.append(f"\\newcommand{{\\{macro}}}{{{formatted}}}")
+    return "\n".join(lines) + "\n"
+
+
+AggregationResult = tuple[dict[str, float], list[dict[str, Any]]]
 
-    variables_path.write_text("\n".join(lines) + "\n")
+
+def _evaluate_aggregations(repo_root: Path) -> AggregationResult:
+    from truthweave.aggregations import evaluate, parse_specs
+
+    pipeline = _load_pipeline_config(repo_root)
+    assets_cfg = pipeline.get("assets", {}) if isinstance(pipeline, dict) else {}
+    specs = parse_specs((assets_cfg or {}).get("aggregations"))
+    if not specs:
+        return {}, []
+
+    from truthweave.analysis.aggregate import aggregate
+
+    runs_dir = _latest_runs_dir(repo_root)
+    table, _, _ = aggregate(runs_dir)
+    hashes = _hashes()
+    return evaluate(
+        table, specs, runs_dir, lambda path: sha256_file(path, hashes), repo_root
+    )
+
+
+def _assets_up_to_date(
+    manifest_path: Path, variables_path: Path, source: dict[str, Any]
+) -> bool:
+    if not manifest_path.exists() or not variables_path.exists():
+        return False
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except json.JSONDecodeError:
+        return False
+    generated = manifest.get("generated", {})
+    variables_sha256 = sha256_file(variables_path, _hashes())
+    return (
+        manifest.get("source") == source
+        and generated.get("generator_version") == __version__
+        and generated.get("variables_tex_sha256") == variables_sha256
+    )
+
+
+def _write_assets(
+    auto_dir: Path,
+    metrics_path: Path,
+    source: dict[str, Any],
+    aggregations: AggregationResult = ({}, []),
+) -> str:
+    macros, records = aggregations
+    if records:
+        source = {**source, "aggregations": records}
+    ensure_dir(auto_dir)
+    variables_path = auto_dir / "variables.tex"
+    manifest_path = auto_dir / "MANIFEST.json"
+    if _assets_up_to_date(manifest_path, variables_path, source):
+        return "skipped"
+
+    metrics = json.loads(metrics_path.read_text())
+    write_text_atomic(variables_path, _render_variables(metrics, macros))
 
     manifest = {
-        "source": {
-            "paper_id": paper_id,
-            "run_dir": str(run_dir.relative_to(repo_root)),
-            "metrics_source": metrics_source or "latest",
-            "metrics_json_path": str(metrics_path.relative_to(repo_root)),
-            "metrics_json_sha256": sha256_file(metrics_path),
-        },
+        "source": source,
         "generated": {
-            "variables_tex_sha256": sha256_file(variables_path),
+            "variables_tex_sha256": sha256_file(variables_path, _hashes()),
+            "generator_version": __version__,
             "generated_at": datetime.now(timezone.utc).isoformat(),
         },
     }
-    write_json(auto_dir / "MANIFEST.json", manifest)
+    write_text_atomic(manifest_path, json.dumps(manifest, indent=2, sort_keys=True))
+    return "regenerated"
+
+
+def _build_paper_assets(
+    paper_id: str,
+    paper: dict[str, Any] | None = None,
+    resolve_source: Callable[[str | None], Path] | None = None,
+    aggregations: AggregationResult | None = None,
+    config: PaperConfig | None = None,
+) -> str:
+    repo_root = _repo_root()
+    if paper is None:
+        paper = get_paper_by_id(repo_root, paper_id)
+    if resolve_source is None:
+        resolve_source = partial(_resolve_metrics_source, repo_root)
+    if aggregations is None:
+        aggregations = _evaluate_aggregations(repo_root)
+    paper_dir = repo_root / paper["path"]
+    if config is None:
+        config = load_paper_config(paper_dir / "truthweave.yml")
+    metrics_source = config.inputs.get("metrics_source")
+
+    run_dir = resolve_source(metrics_source)
+    metrics_path = run_dir / "metrics.json"
+    if not metrics_path.exists():
+        raise SystemExit(f"Missing metrics.json in {run_dir}")
+
+    source = {
+        "paper_id": paper_id,
+        "run_dir": str(run_dir.relative_to(repo_root)),
+        "metrics_source": metrics_source or "latest",
+        "metrics_json_path": str(metrics_path.relative_to(repo_root)),
+        "metrics_json_sha256": sha256_file(metrics_path, _hashes()),
+    }
+    auto_dir = paper_dir / config.paths["auto_dir"]
+    return _write_assets(auto_dir, metrics_path, source, aggregations)
+
+
+def _select_papers(
+    repo_root: Path, paper_arg: str | None, all_papers: bool
+) -> list[dict[str, Any]]:
+    manifest = discover_papers(repo_root)
+    by_id = {paper["paper_id"]: paper for paper in manifest["papers"]}
+    if all_papers:
+        return list(by_id.values())
+    selected = []
+    for paper_id in (p.strip() for p in (paper_arg or "").split(",")):
+        if not paper_id:
+            continue
+        if paper_id not in by_id:
+            raise SystemExit(
+                f"Unknown paper_id '{paper_id}'. Run truthweave discover."
+            )
+        selected.append(by_id[paper_id])
+    return selected
 
 
-def _build_paper(paper_id: str) -> None:
+def _resolve_sources(
+    repo_root: Path, sources: set[str | None]
+) -> Callable[[str | None], Path]:
+    resolved: dict[str | None, Path | str] = {}
+    for source in sources:
+        try:
+            resolved[source] = _resolve_metrics_source(repo_root, source)
+        except SystemExit as exc:
+            resolved[source] = str(exc)
+
+    def resolve(source: str | None) -> Path:
+        result = resolved[None if source == "latest" else source]
+        if isinstance(result, str):
+            raise SystemExit(result)
+        return result
+
+    return resolve
+
+
+def _build_assets_batch(papers: list[dict[str, Any]], jobs: int | None) -> None:
+    repo_root = _repo_root()
+    configs: dict[str, PaperConfig | str] = {}
+    for paper in papers:
+        try:
+            configs[paper["paper_id"]] = load_paper_config(
+                repo_root / paper["path"] / "truthweave.yml"
+            )
+        except SystemExit as exc:
+            configs[paper["paper_id"]] = str(exc)
+    sources: set[str | None] = set()
+    for config in configs.values():
+        if isinstance(config, PaperConfig):
+            source = config.inputs.get("metrics_source")
+            sources.add(None if source == "latest" else source)
+    resolve_source = _resolve_sources(repo_root, sources)
+    aggregations = _evaluate_aggregations(repo_root)
+
+    def build(paper: dict[str, Any]) -> str:
+        config = configs[paper["paper_id"]]
+        if isinstance(config, str):
+            raise SystemExit(config)
+        return _build_paper_assets(
+            paper["paper_id"], paper, resolve_source, aggregations, config
+        )
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(build, paper) for paper in papers]
+        for paper, future in zip(papers, futures):
+            try:
+                status = future.result()
+            except (Exception, SystemExit) as exc:
+                failed += 1
+                status = f"failed ({exc})"
+            print(f"{paper['paper_id']}: {status}")
+    if failed:
+        raise SystemExit(1)
+
+
+_TEX_SOURCE_SUFFIXES = {".tex", ".bib", ".sty", ".cls", ".bst"}
+
+
+def _build_inputs_digest(
+    paper_dir: Path,
+    output_dir: Path,
+    config: PaperConfig,
+    cmd: list[str],
+    texinputs: str,
+) -> str:
+    input_dirs = [paper_dir / path for path in config.paths.values()]
+    for entry in config.style.get("TEXINPUTS", ["styles", "."]):
+        entry_path = paper_dir / entry
+        if entry_path.resolve() != paper_dir.resolve():
+            input_dirs.append(entry_path)
+
+    files = {paper_dir / config.main, paper_dir / config.bib}
+    for path in paper_dir.rglob("*"):
+        if output_dir in path.parents or not path.is_file():
+            continue
+        if path.suffix in _TEX_SOURCE_SUFFIXES or any(
+            d in path.parents for d in input_dirs
+        ):
+            files.add(path)
+    resolved_paper_dir = paper_dir.resolve()
+    for input_dir in input_dirs:
+        resolved = input_dir.resolve()
+        if resolved == resolved_paper_dir or resolved_paper_dir in resolved.parents:
+            continue
+        files.update(path for path in input_dir.rglob("*") if path.is_file())
+
+    hashes = _hashes()
+    h = hashlib.sha256()
+    h.update(json.dumps({"cmd": cmd, "TEXINPUTS": texinputs}).encode())
+    for path in sorted(files):
+        rel = os.path.relpath(path, paper_dir)
+        digest = sha256_file(path, hashes) if path.exists() else "missing"
+        h.update(f"{rel}\0{digest}\n".encode())
+    return h.hexdigest()
+
+
+def _build_paper(
+    paper_id: str,
+    paper: dict[str, Any] | None = None,
+    log_path: Path | None = None,
+    force: bool = False,
+) -> str:
     repo_root = _repo_root()
-    paper = get_paper_by_id(repo_root, paper_id)
+    if paper is None:
+        paper = get_paper_by_id(repo_root, paper_id)
     paper_dir = repo_root / paper["path"]
     config = load_paper_config(paper_dir / "truthweave.yml")
-    main_path = paper_dir / config["main"]
+    main_path = paper_dir / config.main
     if not main_path.exists():
         raise SystemExit(f"Missing main tex for {paper_id}: {main_path}")
 
-    engine = config["engine"]
+    engine = config.engine
     output_dir = paper_dir / "build"
     ensure_dir(output_dir)
 
     if engine == "latexmk":
-        latexmk_args = config.get("build", {}).get(
+        latexmk_args = config.build.get(
             "latexmk_args", ["-pdf", "-interaction=nonstopmode"]
         )
         if not isinstance(latexmk_args, list):
@@ -156,21 +376,22 @@ def _build_paper(paper_id: str) -> None:
             str(output_dir),
             str(main_path),
         ]
+        pdf_path = output_dir / f"{main_path.stem}.pdf"
     elif engine in {"pdflatex", "xelatex"}:
         cmd = [
             engine,
             "-interaction=nonstopmode",
             str(main_path),
         ]
+        pdf_path = paper_dir / f"{main_path.stem}.pdf"
     else:
         raise SystemExit(f"Unsupported engine '{engine}' for paper {paper_id}")
 
     if shutil.which(cmd[0]) is None:
         raise SystemExit(f"Missing tool '{cmd[0]}'; install it to build papers.")
 
-    style = config.get("style", {})
     texinputs = []
-    for entry in style.get("TEXINPUTS", ["styles", "."]):
+    for entry in config.style.get("TEXINPUTS", ["styles", "."]):
         entry_path = (paper_dir / entry).resolve()
         texinputs.append(str(entry_path))
     texinputs_str = os.pathsep.join(texinputs) + os.pathsep + os.environ.get(
@@ -179,10 +400,79 @@ def _build_paper(paper_id: str) -> None:
     env = os.environ.copy()
     env["TEXINPUTS"] = texinputs_str
 
-    subprocess.run(cmd, check=True, cwd=paper_dir, env=env)
+    digest_path = output_dir / "inputs_digest.json"
+    digest = _build_inputs_digest(paper_dir, output_dir, config, cmd, texinputs_str)
+    if not force and digest_path.exists() and pdf_path.exists():
+        try:
+            recorded = json.loads(digest_path.read_text()).get("digest")
+        except json.JSONDecodeError:
+            recorded = None
+        if recorded == digest:
+            return "up to date"
+
+    if log_path is None:
+        subprocess.run(cmd, check=True, cwd=paper_dir, env=env)
+    else:
+        with log_path.open("w") as log:
+            subprocess.run(
+                cmd,
+                check=True,
+                cwd=paper_dir,
+                env=env,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+    write_text_atomic(digest_path, json.dumps({"digest": digest}, indent=2) + "\n")
+    return "built"
+
+
+def _build_papers_batch(
+    papers: list[dict[str, Any]], jobs: int | None, force: bool = False
+) -> None:
+    repo_root = _repo_root()
 
+    def build(paper: dict[str, Any]) -> tuple[str, float, Path]:
+        log_path = repo_root / paper["path"] / "build" / "build.log"
+        start = time.perf_counter()
+        try:
+            status = _build_paper(paper["paper_id"], paper, log_path, force)
+        except subprocess.CalledProcessError as exc:
+            status = f"failed (exit {exc.returncode})"
+        except (Exception, SystemExit) as exc:
+            status = f"failed ({exc})"
+        return status, time.perf_counter() - start, log_path
+
+    results: dict[str, tuple[str, float, Path]] = {}
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        futures = {pool.submit(build, paper): paper["paper_id"] for paper in papers}
+        for future in as_completed(futures):
+            paper_id = futures[future]
+            results[paper_id] = future.result()
+            status, elapsed, _ = results[paper_id]
+            print(f"[{status}] {paper_id} ({elapsed:.1f}s)")
+
+    rows = [
+        (
+            paper_id,
+            status,
+            f"{elapsed:.1f}s",
+            str(log_path.relative_to(repo_root)) if log_path.exists() else "-",
+        )
+        for paper_id, (status, elapsed, log_path) in sorted(results.items())
+    ]
+    header = ("Paper", "Status", "Time", "Log")
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    print()
+    for row in [header, *rows]:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+
+    failed = sum(1 for status, _, _ in results.values() if status.startswith("failed"))
+    print(f"Built {len(results) - failed}/{len(results)} papers")
+    if failed:
+        raise SystemExit(1)
 
-def _build_paper_assets_legacy() -> None:
+
+def _build_paper_assets_legacy() -> str:
     repo_root = _repo_root()
     runs_dir = repo_root / "runs"
     run_dir = find_latest_run(runs_dir)
@@ -193,37 +483,35 @@ def _build_paper_assets_legacy() -> None:
     if not metrics_path.exists():
         raise SystemExit(f"Missing metrics.json in {run_dir}")
 
-    metrics = json.loads(metrics_path.read_text())
-
-    auto_dir = repo_root / "paper" / "auto"
-    ensure_dir(auto_dir)
-    variables_path = auto_dir / "variables.tex"
+    source = {
+        "run_dir": str(run_dir.relative_to(repo_root)),
+        "metrics_json_path": str(metrics_path.relative_to(repo_root)),
+        "metrics_json_sha256": sha256_file(metrics_path, _hashes()),
+    }
+    return _write_assets(
+        repo_root / "paper" / "auto",
+        metrics_path,
+        source,
+        _evaluate_aggregations(repo_root),
+    )
 
-    lines = []
-    for key, value in metrics.items():
-        macro = _metric_macro_name(key)
-        formatted = _format_metric_value(value)
-        lines.append(f"\\newcommand{{\\{macro}}}{{{formatted}}}")
 
-    variables_path.write_text("\n".join(lines) + "\n")
+def _snapshot_cache_dir(repo_root: Path) -> Path | None:
+    from truthweave import snapshot
 
-    manifest = {
-        "source": {
-            "run_dir": str(run_dir.relative_to(repo_root)),
-            "metrics_json_path": str(metrics_path.relative_to(repo_root)),
-            "metrics_json_sha256": sha256_file(metrics_path),
-        },
-        "generated": {
-            "variables_tex_sha256": sha256_file(variables_path),
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-        },
-    }
-    write_json(auto_dir / "MANIFEST.json", manifest)
+    return snapshot.snapshot_cache_dir(
+        repo_root / "artifacts" / "cache" / "snapshots", repo_root / "uv.lock"
+    )
 
 
-def run_command(overrides: list[str]) -> None:
-    from paperops import experiments  # noqa: F401
+def run_command(overrides: list[str], use_cache: bool = True) -> None:
+    from truthweave import experiments  # noqa: F401
+    from truthweave.cas import blob_store_for
+    from truthweave.registry import get_experiment_class
+    from truthweave.result_cache import HIT_RECORD, result_cache_for
+    from truthweave.runner import ExperimentRunner
 
+    repo_root = _repo_root()
     cfg = _load_config(overrides)
     run_dir = _resolve_run_dir(cfg)
 
@@ -231,26 +519,119 @@ def run_command(overrides: list[str]) -> None:
     experiment_cls = get_experiment_class(experiment_name)
     experiment = experiment_cls(cfg, run_dir)
 
-    runner = ExperimentRunner(cfg, run_dir, experiment)
+    runner = ExperimentRunner(
+        cfg,
+        run_dir,
+        experiment,
+        snapshot_cache_dir=_snapshot_cache_dir(repo_root),
+        result_cache=result_cache_for(repo_root, cfg) if use_cache else None,
+        hash_cache=_hashes(),
+        blob_store=blob_store_for(repo_root, cfg),
+    )
     runner.run()
+    if (run_dir / HIT_RECORD).exists():
+        print(f"Reused cached results for {run_dir.relative_to(repo_root)}")
+
+
+def sweep_command(
+    overrides: list[str], jobs: int | None, use_cache: bool = True
+) -> None:
+    from truthweave.sweep import run_sweep
+
+    repo_root = _repo_root()
+    results = run_sweep(
+        repo_root,
+        overrides,
+        max_workers=jobs,
+        snapshot_cache_dir=_snapshot_cache_dir(repo_root),
+        use_cache=use_cache,
+    )
+    failed = 0
+    for job, error in results:
+        rel = job.run_dir.relative_to(repo_root)
+        if error is None:
+            print(f"[ok] {rel}")
+        else:
+            failed += 1
+            print(f"[failed] {rel}: {error}")
+    print(f"Sweep: {len(results)} runs, {failed} failed")
+    if failed:
+        raise SystemExit(1)
+
+
+def compose_command(overrides: list[str], all_exps: bool) -> None:
+    from omegaconf import OmegaConf
+
+    from truthweave.compose import compose_each
+
+    config_dir = _repo_root() / "conf"
+    if all_exps:
+        exp_names = sorted(path.stem for path in (config_dir / "exp").glob("*.yaml"))
+        override_sets = [[f"exp={name}", *overrides] for name in exp_names]
+    else:
+        override_sets = [overrides]
+
+    start = time.perf_counter()
+    results = compose_each(config_dir, override_sets)
+    elapsed = time.perf_counter() - start
+    if not all_exps and results[0].error is None:
+        print(OmegaConf.to_yaml(results[0].cfg, resolve=True), end="")
+    failed = 0
+    for result in results:
+        label = " ".join(result.overrides) or "(no overrides)"
+        if result.error is None:
+            print(f"[ok] {label}: {result.seconds * 1000:.1f} ms")
+        else:
+            failed += 1
+            print(f"[error] {label}: {result.seconds * 1000:.1f} ms: {result.error}")
+    print(f"Composed {len(results)} configs, {failed} failed in {elapsed:.2f}s")
+    if failed:
+        raise SystemExit(1)
 
 
 def discover_command() -> None:
     write_discovery_manifest(_repo_root())
 
 
-def build_paper_assets_command(paper_id: str | None) -> None:
+def reindex_command() -> None:
+    from truthweave.run_index import rebuild_index
+
+    runs_dir = _latest_runs_dir(_repo_root())
+    count = rebuild_index(runs_dir)
+    print(f"Indexed {count} runs under {runs_dir}")
+
+
+def build_paper_assets_command(
+    paper_id: str | None, all_papers: bool = False, jobs: int | None = None
+) -> None:
+    if all_papers or (paper_id and "," in paper_id):
+        _build_assets_batch(_select_papers(_repo_root(), paper_id, all_papers), jobs)
+        return
     if paper_id is None:
         legacy_dir = _repo_root() / "paper"
         if legacy_dir.exists():
-            _build_paper_assets_legacy()
+            status = _build_paper_assets_legacy()
+            print(f"paper: {status}")
             return
         raise SystemExit("Provide --paper <paper_id> for multi-paper assets.")
-    _build_paper_assets(paper_id)
+    status = _build_paper_assets(paper_id)
+    print(f"{paper_id}: {status}")
 
 
-def build_paper_command(paper_id: str) -> None:
-    _build_paper(paper_id)
+def build_paper_command(
+    paper_id: str | None,
+    all_papers: bool = False,
+    jobs: int | None = None,
+    force: bool = False,
+) -> None:
+    if all_papers or (paper_id and "," in paper_id):
+        papers = _select_papers(_repo_root(), paper_id, all_papers)
+        _build_papers_batch(papers, jobs, force)
+        return
+    if paper_id is None:
+        raise SystemExit("Provide --paper <paper_id> or --all.")
+    status = _build_paper(paper_id, force=force)
+    print(f"{paper_id}: {status}")
 
 
 def _format_issue(issue: Issue) -> str:
@@ -266,42 +647,113 @@ def _format_issue(issue: Issue) -> str:
 
 
 def check_structure_command(mode: str) -> list[Issue]:
+    from truthweave.checks import check_structure
+
     repo_root = _repo_root()
     return check_structure.check(repo_root, mode)
 
 
-def check_command(paper_id: str | None, mode: str) -> None:
-    repo_root = _repo_root()
-    issues: list[Issue] = []
+def _check_settings(repo_root: Path) -> dict[str, Any]:
+    pipeline = _load_pipeline_config(repo_root)
+    checks_cfg = pipeline.get("checks", {}) if isinstance(pipeline, dict) else {}
+    return checks_cfg if isinstance(checks_cfg, dict) else {}
 
-    issues.extend(check_structure_command(mode))
-    issues.extend(check_run_integrity.check(repo_root / "runs", mode, paper_id))
 
-    if paper_id:
-        paper = get_paper_by_id(repo_root, paper_id)
-        paper_dir = repo_root / paper["path"]
-        config = load_paper_config(paper_dir / "truthweave.yml")
-        issues.extend(
-            check_paper_freshness.check(repo_root, paper_dir, paper_id, mode)
+def check_command(
+    paper_id: str | None,
+    mode: str,
+    profile: bool = False,
+    jobs: int | None = None,
+    timeout: float | None = None,
+) -> None:
+    from truthweave.checks import (
+        check_no_manual_numbers,
+        check_paper_freshness,
+        check_run_integrity,
+    )
+    from truthweave.checks.context import CheckContext
+    from truthweave.checks.scheduler import CheckTask, run_checks
+
+    repo_root = _repo_root()
+    settings = _check_settings(repo_root)
+    if jobs is None:
+        jobs = settings.get("jobs")
+    if timeout is None:
+        timeout = settings.get("timeout_seconds")
+    per_check_timeouts = settings.get("timeouts") or {}
+
+    start = time.perf_counter()
+    context = CheckContext.build(repo_root, mode, paper_id)
+    discover_elapsed = time.perf_counter() - start
+
+    pinned = [
+        str(config.inputs["metrics_source"])
+        for config in context.configs.values()
+        if config.inputs.get("metrics_source")
+    ]
+    tasks: list[CheckTask] = [
+        CheckTask("check_structure", partial(check_structure_command, mode)),
+        CheckTask(
+            "check_run_integrity",
+            partial(
+                check_run_integrity.check,
+                repo_root / "runs",
+                mode,
+                paper_id,
+                pinned,
+                _hashes(),
+            ),
+        ),
+    ]
+    for pid in context.papers:
+        tasks.append(
+            CheckTask(
+                f"check_paper_freshness[{pid}]",
+                partial(
+                    check_paper_freshness.check,
+                    repo_root,
+                    context.paper_dir(pid),
+                    pid,
+                    mode,
+                    context,
+                ),
+            )
         )
-        tex_path = paper_dir / config.get("main", "main.tex")
-        issues.extend(check_no_manual_numbers.check(tex_path, mode, paper_id))
-    else:
-        manifest = write_discovery_manifest(repo_root)
-        data = json.loads(manifest.read_text())
-        for paper in data.get("papers", []):
-            pid = paper["paper_id"]
-            paper_dir = repo_root / paper["path"]
-            issues.extend(
-                check_paper_freshness.check(repo_root, paper_dir, pid, mode)
+        tasks.append(
+            CheckTask(
+                f"check_no_manual_numbers[{pid}]",
+                partial(
+                    check_no_manual_numbers.check,
+                    context.tex_path(pid),
+                    mode,
+                    pid,
+                    [context.auto_dir(pid)],
+                ),
             )
-            config = load_paper_config(paper_dir / "truthweave.yml")
-            tex_path = paper_dir / config.get("main", "main.tex")
-            issues.extend(check_no_manual_numbers.check(tex_path, mode, pid))
-
+        )
+    if paper_id is None:
         legacy_main = repo_root / "paper" / "main.tex"
         if legacy_main.exists():
-            issues.extend(check_no_manual_numbers.check(legacy_main, mode, None))
+            tasks.append(
+                CheckTask(
+                    "check_no_manual_numbers[paper]",
+                    partial(check_no_manual_numbers.check, legacy_main, mode, None),
+                )
+            )
+    for task in tasks:
+        base_name = task.name.split("[", 1)[0]
+        task.timeout = per_check_timeouts.get(base_name, timeout)
+
+    recheck = f"uv run truthweave check --mode {mode}" + (
+        f" --paper {paper_id}" if paper_id else ""
+    )
+    results = run_checks(tasks, jobs=jobs, recheck=recheck)
+    issues: list[Issue] = [issue for result in results for issue in result.issues]
+
+    if profile:
+        print(f"[profile] discover: {discover_elapsed * 1000:.1f} ms")
+        for result in results:
+            print(f"[profile] {result.name}: {result.elapsed * 1000:.1f} ms")
 
     warn_count = sum(1 for issue in issues if issue.severity == "WARN")
     fail_count = sum(1 for issue in issues if issue.severity == "FAIL")
@@ -314,26 +766,136 @@ def check_command(paper_id: str | None, mode: str) -> None:
         raise SystemExit(1)
 
 
-def main() -> None:
+def _referenced_runs(repo_root: Path) -> list[Path]:
+    runs_dir = _latest_runs_dir(repo_root)
+    run_dirs: dict[Path, None] = {}
+    for config in discover_paper_configs(repo_root)[1].values():
+        source = config.inputs.get("metrics_source")
+        if source in (None, "latest"):
+            latest = find_latest_run(runs_dir)
+            if latest is not None:
+                run_dirs[latest] = None
+        else:
+            run_dirs[runs_dir / str(source)] = None
+    return list(run_dirs)
+
+
+def verify_runs_command(
+    jobs: int | None, referenced: bool = False, rehash: bool = False
+) -> None:
+    from truthweave.run_manifest import RUN_MANIFEST, verify_runs
+
+    repo_root = _repo_root()
+    runs_dir = _latest_runs_dir(repo_root)
+    if referenced:
+        run_dirs = _referenced_runs(repo_root)
+    elif runs_dir.exists():
+        with os.scandir(runs_dir) as it:
+            run_dirs = sorted(Path(entry.path) for entry in it if entry.is_dir())
+    else:
+        run_dirs = []
+
+    start = time.perf_counter()
+    results = verify_runs(run_dirs, None if rehash else repo_root, jobs)
+    elapsed = time.perf_counter() - start
+
+    failed = [result for result in results if result.problems]
+    unmanifested = sum(1 for result in results if not result.has_manifest)
+    for result in failed:
+        print(f"[failed] {result.run_id}: {'; '.join(result.problems)}")
+    print(
+        f"Verified {len(results)} runs ({sum(r.files for r in results)} files) "
+        f"in {elapsed:.2f}s: {len(failed)} failed, "
+        f"{unmanifested} without {RUN_MANIFEST}"
+    )
+    if failed:
+        raise SystemExit(1)
+
+
+def gc_command(grace_seconds: float, dry_run: bool) -> None:
+    from truthweave.cas import BlobStore, default_store_root
+
+    store = BlobStore(default_store_root(_repo_root()))
+    stats = store.gc(grace_seconds, dry_run)
+    verb = "Would remove" if dry_run else "Removed"
+    print(
+        f"{verb} {stats['removed']} unreferenced blobs "
+        f"({stats['freed_bytes'] / 1024 / 1024:.1f} MB), kept {stats['kept']}"
+    )
+
+
+def _warm_up(repo_root: Path) -> None:
+    import hydra  # noqa: F401
+    from omegaconf import OmegaConf  # noqa: F401
+
+    from truthweave import experiments, runner, snapshot, sweep  # noqa: F401
+    from truthweave.checks import context, scheduler  # noqa: F401
+
+    discover_papers(repo_root)
+    _hashes().preload()
+
+
+def serve_command(socket_path: str | None) -> None:
+    repo_root = _repo_root()
+    path = Path(socket_path) if socket_path else daemon.default_socket_path(repo_root)
+    _warm_up(repo_root)
+    daemon.serve(path, main)
+
+
+def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+
     parser = argparse.ArgumentParser(prog="truthweave")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     run_parser = subparsers.add_parser("run", help="Run an experiment")
+    run_parser.add_argument("--no-cache", dest="use_cache", action="store_false")
     run_parser.add_argument("overrides", nargs=argparse.REMAINDER)
 
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="Run a multirun sweep in a process pool"
+    )
+    sweep_parser.add_argument("--jobs", type=int)
+    sweep_parser.add_argument("--no-cache", dest="use_cache", action="store_false")
+    sweep_parser.add_argument("overrides", nargs=argparse.REMAINDER)
+
+    compose_parser = subparsers.add_parser(
+        "compose", help="Compose and validate configs without running them"
+    )
+    compose_parser.add_argument(
+        "--all-exps", action="store_true", help="Compose every conf/exp/*.yaml"
+    )
+    compose_parser.add_argument("overrides", nargs=argparse.REMAINDER)
+
     subparsers.add_parser("discover", help="Discover papers")
+    subparsers.add_parser("reindex", help="Rebuild the run index from runs/")
 
     assets_parser = subparsers.add_parser(
         "build-paper-assets", help="Generate paper assets"
     )
-    assets_parser.add_argument("--paper")
+    assets_parser.add_argument("--paper", help="Paper id or comma-separated ids")
+    assets_parser.add_argument("--all", dest="all_papers", action="store_true")
+    assets_parser.add_argument("--jobs", type=int)
 
     build_parser = subparsers.add_parser("build-paper", help="Build a paper")
-    build_parser.add_argument("--paper", required=True)
+    build_parser.add_argument("--paper", help="Paper id or comma-separated ids")
+    build_parser.add_argument("--all", dest="all_papers", action="store_true")
+    build_parser.add_argument("--jobs", type=int)
+    build_parser.add_argument(
+        "--force", action="store_true", help="Rebuild even if inputs are unchanged"
+    )
 
     check_parser = subparsers.add_parser("check", help="Run checks")
     check_parser.add_argument("--paper")
     check_parser.add_argument("--mode", choices=["dev", "ci"], default="dev")
+    check_parser.add_argument(
+        "--profile", action="store_true", help="Print time spent in each check"
+    )
+    check_parser.add_argument("--jobs", type=int)
+    check_parser.add_argument(
+        "--timeout", type=float, help="Per-check timeout in seconds"
+    )
 
     structure_parser = subparsers.add_parser(
         "check-structure", help="Check repository structure"
@@ -361,27 +923,72 @@ def main() -> None:
     )
     create_dataset_parser.add_argument("dataset_id")
 
-    args = parser.parse_args()
+    verify_parser = subparsers.add_parser(
+        "verify-runs", help="Verify run dirs against their RUN_MANIFEST.json"
+    )
+    verify_parser.add_argument("--jobs", type=int)
+    verify_parser.add_argument(
+        "--referenced",
+        action="store_true",
+        help="Only verify runs referenced by papers (inputs.metrics_source)",
+    )
+    verify_parser.add_argument(
+        "--rehash", action="store_true", help="Ignore cached digests"
+    )
+
+    gc_parser = subparsers.add_parser(
+        "gc", help="Remove artifact blobs that no run references"
+    )
+    gc_parser.add_argument(
+        "--grace-seconds",
+        type=float,
+        default=3600.0,
+        help="Keep blobs linked or unlinked more recently than this",
+    )
+    gc_parser.add_argument("--dry-run", action="store_true")
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Serve CLI requests from a warm process on a Unix socket"
+    )
+    serve_parser.add_argument("--socket", help="Socket path")
+
+    args = parser.parse_args(argv)
 
     if args.command == "run":
         overrides = [arg for arg in args.overrides if arg]
-        run_command(overrides)
+        run_command(overrides, args.use_cache)
+    elif args.command == "sweep":
+        overrides = [arg for arg in args.overrides if arg]
+        sweep_command(overrides, args.jobs, args.use_cache)
+    elif args.command == "compose":
+        overrides = [arg for arg in args.overrides if arg]
+        compose_command(overrides, args.all_exps)
     elif args.command == "discover":
         discover_command()
+    elif args.command == "reindex":
+        reindex_command()
     elif args.command == "build-paper-assets":
-        build_paper_assets_command(args.paper)
+        build_paper_assets_command(args.paper, args.all_papers, args.jobs)
     elif args.command == "build-paper":
-        build_paper_command(args.paper)
+        build_paper_command(args.paper, args.all_papers, args.jobs, args.force)
     elif args.command == "create-paper":
         create_paper_command(args.paper_id, args.from_paper, args.engine)
     elif args.command == "check":
-        check_command(args.paper, args.mode)
+        check_command(args.paper, args.mode, args.profile, args.jobs, args.timeout)
     elif args.command == "check-structure":
+        start = time.perf_counter()
         issues = check_structure_command(args.mode)
         for issue in issues:
             print(_format_issue(issue))
+        print(f"Structure check finished in {time.perf_counter() - start:.2f}s")
         if any(issue.severity == "FAIL" for issue in issues):
             raise SystemExit(1)
+    elif args.command == "verify-runs":
+        verify_runs_command(args.jobs, args.referenced, args.rehash)
+    elif args.command == "gc":
+        gc_command(args.grace_seconds, args.dry_run)
+    elif args.command == "serve":
+        serve_command(args.socket)
     elif args.command == "create-exp":
         create_exp_command(args.exp_name)
     elif args.command == "create-analysis":
@@ -399,6 +1006,8 @@ if __name__ == "__main__":
 def create_paper_command(
     paper_id: str, base_paper_id: str | None, engine: str | None
 ) -> None:
+    from omegaconf import OmegaConf
+
     repo_root = _repo_root()
     papers_root = repo_root / "papers"
     ensure_dir(papers_root)
@@ -426,10 +1035,10 @@ def create_paper_command(
 
         config_path = target_dir / "truthweave.yml"
         config = load_paper_config(config_path)
-        config["paper_id"] = paper_id
+        config.paper_id = paper_id
         if engine:
-            config["engine"] = engine
-        OmegaConf.save(OmegaConf.create(config), config_path)
+            config.engine = engine
+        OmegaConf.save(OmegaConf.create(config.to_dict()), config_path)
     else:
         ensure_dir(target_dir)
         for subdir in ["styles", "auto", "figures", "tables"]:
@@ -523,10 +1132,10 @@ def create_exp_command(exp_name: str) -> None:
         "    def setup(self) -> None:\n"
         f"        self.cfg_section = self.cfg.{exp_name}\n\n"
         "    def run(self) -> dict[str, float | str]:\n"
-        "        return {\n"
-        "            \"status\": \"ok\",\n"
-        "            \"dummy_metric\": 1.0,\n"
-        "        }\n\n"
+        "        # Per-step values go to metrics.jsonl; metrics.json keeps the last\n"
+        "        # value of each key, updated with the dict returned here.\n"
+        "        self.metrics.log(step=0, dummy_metric=1.0)\n"
+        "        return {\"status\": \"ok\"}\n\n"
         "    def teardown(self) -> None:\n"
         "        pass\n"
     )
@@ -575,6 +1184,7 @@ def create_analysis_command(analysis_name: str, kind: str | None) -> None:
         "import json\n"
         "from datetime import datetime, timezone\n"
         "from pathlib import Path\n\n"
+        "from truthweave.analysis.arrays import run_arrays\n"
         "from truthweave.utils import find_latest_run, ensure_dir\n\n\n"
         "def main() -> None:\n"
         "    parser = argparse.ArgumentParser()\n"
@@ -593,6 +1203,13 @@ def create_analysis_command(analysis_name: str, kind: str | None) -> None:
         "    if not metrics_path.exists():\n"
         "        raise SystemExit(f\"Missing metrics.json in {run_dir}\")\n"
         "    metrics = json.loads(metrics_path.read_text())\n\n"
+        "    # Dense outputs saved with self.save_array() are memory-mapped on first\n"
+        "    # access; slices such as arrays[\"preds\"][:1000] read only those rows.\n"
+        "    arrays = run_arrays(Path(run_dir))\n"
+        "    array_summary = {\n"
+        "        name: {\"shape\": list(ref.shape), \"dtype\": ref.dtype}\n"
+        "        for name, ref in arrays.items()\n"
+        "    }\n\n"
         "    out_dir = Path(args.out_dir) / \"metrics\"\n"
         "    ensure_dir(out_dir)\n"
         "    out_path = out_dir / f\"" + analysis_name + ".json\"\n"
@@ -601,6 +1218,7 @@ def create_analysis_command(analysis_name: str, kind: str | None) -> None:
         "        \"run_id\": str(run_dir),\n"
         "        \"generated_at\": datetime.now(timezone.utc).isoformat(),\n"
         "        \"metrics\": metrics,\n"
+        "        \"arrays\": array_summary,\n"
         "    }\n"
         "    out_path.write_text(json.dumps(payload, indent=2, sort_keys=True))\n\n\n"
         "if __name__ == \"__main__\":\n"
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import copy
+import itertools
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import hydra
+from hydra.core.config_loader import ConfigLoader
+from hydra.core.global_hydra import GlobalHydra
+from hydra.core.override_parser.overrides_parser import OverridesParser
+from hydra.core.override_parser.types import Override, OverrideType
+from hydra.errors import ConfigCompositionException
+from omegaconf import OmegaConf
+from omegaconf.errors import ConfigAttributeError, ConfigKeyError
+
+
+@dataclass
+class ComposeResult:
+    overrides: list[str]
+    cfg: Any | None
+    seconds: float
+    error: str | None = None
+
+
+def expand_sweep(overrides: list[str]) -> list[list[str]]:
+    parser = OverridesParser.create()
+    choices: dict[str, list[str]] = {}
+    for override in parser.parse_overrides(overrides):
+        key = override.get_key_element()
+        if override.is_sweep_override():
+            if not override.is_discrete_sweep():
+                raise SystemExit(f"Unsupported sweep override: {override.input_line}")
+            choices[key] = [f"{key}={val}" for val in override.sweep_string_iterator()]
+        else:
+            choices[key] = [f"{key}={override.get_value_element_as_str()}"]
+    return [list(combo) for combo in itertools.product(*choices.values())]
+
+
+def _config_groups(loader: ConfigLoader, parent: str = "") -> set[str]:
+    groups = set()
+    for name in loader.list_groups(parent):
+        group = f"{parent}/{name}" if parent else name
+        groups.add(group)
+        groups |= _config_groups(loader, group)
+    return groups
+
+
+def _is_delta(override: Override, groups: set[str]) -> bool:
+    return (
+        override.type in (OverrideType.CHANGE, OverrideType.FORCE_ADD)
+        and not override.is_sweep_override()
+        and override.package is None
+        and not override.key_or_group.startswith("hydra")
+        and override.key_or_group.replace(".", "/") not in groups
+    )
+
+
+def _apply_delta(cfg: Any, override: Override) -> None:
+    key = override.key_or_group
+    force_add = override.is_force_add()
+    try:
+        OmegaConf.update(cfg, key, override.value(), merge=True, force_add=force_add)
+    except (ConfigAttributeError, ConfigKeyError) as exc:
+        raise ConfigCompositionException(
+            f"Could not override '{key}'."
+            f"\nTo append to your config use +{override.input_line}"
+        ) from exc
+
+
+def compose_each(
+    config_dir: Path, override_sets: list[list[str]], config_name: str = "base"
+) -> list[ComposeResult]:
+    parser = OverridesParser.create()
+    bases: dict[tuple[str, ...], Any] = {}
+    results = []
+    with hydra.initialize_config_dir(config_dir=str(config_dir), version_base=None):
+        groups = _config_groups(GlobalHydra.instance().config_loader())
+        for overrides in override_sets:
+            start = time.perf_counter()
+            try:
+                parsed = parser.parse_overrides(overrides)
+                deltas = [o for o in parsed if _is_delta(o, groups)]
+                base_key = tuple(
+                    o.input_line for o in parsed if not _is_delta(o, groups)
+                )
+                if base_key not in bases:
+                    bases[base_key] = hydra.compose(
+                        config_name=config_name, overrides=list(base_key)
+                    )
+                cfg = copy.deepcopy(bases[base_key])
+                for override in deltas:
+                    _apply_delta(cfg, override)
+                OmegaConf.to_container(cfg, resolve=True)
+            except Exception as exc:
+                elapsed = time.perf_counter() - start
+                error = f"{type(exc).__name__}: {exc}"
+                results.append(ComposeResult(overrides, None, elapsed, error))
+                continue
+            results.append(
+                ComposeResult(overrides, cfg, time.perf_counter() - start)
+            )
+    return results
+
+
+def compose_many(
+    config_dir: Path, override_sets: list[list[str]], config_name: str = "base"
+) -> list[Any]:
+    results = compose_each(config_dir, override_sets, config_name)
+    for result in results:
+        if result.error is not None:
+            raise SystemExit(
+                f"Failed to compose {' '.join(result.overrides)}: {result.error}"
+            )
+    return [result.cfg for result in results]
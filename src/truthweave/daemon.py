@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+from pathlib import Path
+from typing import Callable
+
+SOCKET_ENV = "TRUTHWEAVE_SOCKET"
+FORWARDED_COMMANDS = {"discover", "check", "build-paper-assets", "build-paper"}
+_MAX_REQUEST = 1 << 20
+
+
+def default_socket_path(repo_root: Path) -> Path:
+    return repo_root / "artifacts" / "cache" / "truthweave.sock"
+
+
+def _read_line(conn: socket.socket, data: bytes) -> bytes:
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(_MAX_REQUEST)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def _exit_code(exc: SystemExit) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def forward(socket_path: Path, argv: list[str]) -> int | None:
+    request = {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+    payload = json.dumps(request).encode() + b"\n"
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        try:
+            conn.connect(str(socket_path))
+        except OSError:
+            return None
+        socket.send_fds(conn, [payload], [0, 1, 2])
+        response = _read_line(conn, b"")
+    if not response:
+        print("truthweave serve closed the connection", file=sys.stderr)
+        return 1
+    return int(json.loads(response)["code"])
+
+
+def maybe_forward(argv: list[str]) -> int | None:
+    socket_path = os.environ.get(SOCKET_ENV)
+    if not socket_path or not argv or argv[0] not in FORWARDED_COMMANDS:
+        return None
+    return forward(Path(socket_path), argv)
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "_Server"
+
+    def handle(self) -> None:
+        data, fds, _, _ = socket.recv_fds(self.request, _MAX_REQUEST, 3)
+        request = json.loads(_read_line(self.request, data))
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+
+        os.environ.clear()
+        os.environ.update(request["env"])
+        os.environ.pop(SOCKET_ENV, None)
+        os.chdir(request["cwd"])
+        try:
+            self.server.dispatch(request["argv"])
+            code = 0
+        except SystemExit as exc:
+            code = _exit_code(exc)
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        self.request.sendall(json.dumps({"code": code}).encode() + b"\n")
+
+
+class _Server(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path, dispatch: Callable[[list[str]], None]):
+        self.dispatch = dispatch
+        super().__init__(str(socket_path), _Handler)
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()
+            return
+    raise SystemExit(f"truthweave serve is already running on {socket_path}")
+
+
+def _interrupt(signum: int, frame: object) -> None:
+    raise KeyboardInterrupt
+
+
+def serve(socket_path: Path, dispatch: Callable[[list[str]], None]) -> None:
+    signal.signal(signal.SIGTERM, _interrupt)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    _remove_stale_socket(socket_path)
+    server = _Server(socket_path, dispatch)
+    print(f"Serving on {socket_path}; export {SOCKET_ENV}={socket_path}")
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
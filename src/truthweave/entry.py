@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import sys
+
+from truthweave import daemon
+
+
+def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    code = daemon.maybe_forward(argv)
+    if code is not None:
+        raise SystemExit(code)
+
+    from truthweave import cli
+
+    cli.main(argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import ast
+import importlib.util
+import platform
+import re
+import shutil
+import subprocess
+import time
+from collections.abc import Callable
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+Probe = Callable[[], dict[str, Any]]
+
+_PROBES: dict[str, Probe] = {}
+DEFAULT_PROBES = ["platform", "cpu", "memory", "gpu", "cuda"]
+
+
+def register_probe(name: str):
+    def decorator(fn: Probe) -> Probe:
+        _PROBES[name] = fn
+        return fn
+
+    return decorator
+
+
+def get_probe(name: str) -> Probe:
+    if name not in _PROBES:
+        available = ", ".join(sorted(_PROBES))
+        raise KeyError(f"Unknown hardware probe '{name}'. Available: {available}")
+    return _PROBES[name]
+
+
+@register_probe("platform")
+def _probe_platform() -> dict[str, Any]:
+    return {
+        "platform": platform.platform(),
+        "uname": platform.uname()._asdict(),
+    }
+
+
+@register_probe("cpu")
+def _probe_cpu() -> dict[str, Any]:
+    import psutil
+
+    return {
+        "cpu_count_logical": psutil.cpu_count(logical=True),
+        "cpu_count_physical": psutil.cpu_count(logical=False),
+    }
+
+
+@register_probe("memory")
+def _probe_memory() -> dict[str, Any]:
+    import psutil
+
+    return {"memory_total_bytes": psutil.virtual_memory().total}
+
+
+@register_probe("gpu")
+def _probe_gpu() -> dict[str, Any]:
+    if shutil.which("nvidia-smi") is None:
+        return {"gpu": []}
+    result = subprocess.run(
+        [
+            "nvidia-smi",
+            "--query-gpu=name,memory.total,driver_version",
+            "--format=csv,noheader,nounits",
+        ],
+        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    lines = result.stdout.strip().splitlines()
+    return {"gpu": [line.strip() for line in lines if line.strip()]}
+
+
+_CUDA_ASSIGNMENT = re.compile(r"^cuda\s*(?::[^=]*)?=\s*(.+)$", re.MULTILINE)
+
+
+def _torch_cuda_version() -> str | None:
+    spec = importlib.util.find_spec("torch")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    version_path = Path(list(spec.submodule_search_locations)[0]) / "version.py"
+    if not version_path.exists():
+        return None
+    match = _CUDA_ASSIGNMENT.search(version_path.read_text())
+    if match is None:
+        return None
+    try:
+        value = ast.literal_eval(match.group(1).strip())
+    except (ValueError, SyntaxError):
+        return None
+    return value if isinstance(value, str) else None
+
+
+@register_probe("cuda")
+def _probe_cuda() -> dict[str, Any]:
+    if importlib.util.find_spec("torch") is None:
+        return {"cuda_version": None}
+    try:
+        torch_version = metadata.version("torch")
+    except metadata.PackageNotFoundError:
+        torch_version = None
+    return {"cuda_version": _torch_cuda_version(), "torch_version": torch_version}
+
+
+def collect(probes: list[str] | None = None) -> dict[str, Any]:
+    names = DEFAULT_PROBES if probes is None else probes
+    info: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+    for name in names:
+        probe = get_probe(name)
+        start = time.perf_counter()
+        info.update(probe())
+        timings[name] = round(time.perf_counter() - start, 6)
+    info["probe_seconds"] = timings
+    return info
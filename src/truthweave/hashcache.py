@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+
+from truthweave.utils import ensure_dir, sha256_file
+
+CACHE_NAME = "hashes.sqlite"
+CACHE_MIN_BYTES = 1 << 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+"""
+
+_CACHES: dict[Path, "HashCache"] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+class HashCache:
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._memory: dict[tuple[str, int, int, int], str] = {}
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            ensure_dir(self.db_path.parent)
+            self._conn = sqlite3.connect(
+                str(self.db_path), timeout=30.0, check_same_thread=False
+            )
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def preload(self) -> int:
+        if not self.db_path.exists():
+            return 0
+        with closing(sqlite3.connect(str(self.db_path), timeout=30.0)) as conn:
+            rows = conn.execute(
+                "SELECT path, size, mtime_ns, inode, digest FROM hashes"
+            ).fetchall()
+        for path, size, mtime_ns, inode, digest in rows:
+            self._memory[(path, size, mtime_ns, inode)] = digest
+        return len(rows)
+
+    def digest(self, path: Path) -> str:
+        resolved = str(path.resolve())
+        st = path.stat()
+        key = (resolved, st.st_size, st.st_mtime_ns, st.st_ino)
+        cached = self._memory.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT size, mtime_ns, inode, digest FROM hashes WHERE path = ?",
+                    (resolved,),
+                )
+                .fetchone()
+            )
+        if row is not None and tuple(row[:3]) == key[1:]:
+            self._memory[key] = row[3]
+            return row[3]
+
+        digest = sha256_file(path)
+        self._store(key, digest)
+        return digest
+
+    def remember(self, path: Path, digest: str) -> None:
+        st = path.stat()
+        self._store(
+            (str(path.resolve()), st.st_size, st.st_mtime_ns, st.st_ino), digest
+        )
+
+    def _store(self, key: tuple[str, int, int, int], digest: str) -> None:
+        self._memory[key] = digest
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO hashes "
+                    "(path, size, mtime_ns, inode, digest) VALUES (?, ?, ?, ?, ?)",
+                    (*key, digest),
+                )
+
+
+def digest_file(path: Path, size: int, cache: HashCache | None) -> str:
+    return sha256_file(path, cache if size >= CACHE_MIN_BYTES else None)
+
+
+def hash_cache_for(repo_root: Path) -> HashCache:
+    db_path = (repo_root / "artifacts" / "cache" / CACHE_NAME).resolve()
+    with _CACHES_LOCK:
+        if db_path not in _CACHES:
+            _CACHES[db_path] = HashCache(db_path)
+        return _CACHES[db_path]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+METRICS_LOG = "metrics.jsonl"
+
+
+def _to_json(value: Any) -> Any:
+    item = getattr(value, "item", None)
+    if callable(item):
+        return item()
+    return str(value)
+
+
+class MetricsWriter:
+    def __init__(
+        self, path: Path, fsync_every: int = 1000, fsync_seconds: float = 5.0
+    ) -> None:
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_seconds = fsync_seconds
+        self.steps = 0
+        self._file: IO[str] | None = None
+        self._unsynced = 0
+        self._last: dict[str, Any] = {}
+        self._last_fsync = time.monotonic()
+
+    def log(self, step: int | None = None, **values: Any) -> None:
+        if step is None:
+            step = self.steps
+        record = {"step": step, **values}
+        if self._file is None:
+            self._file = self.path.open("w")
+        self._file.write(json.dumps(record, sort_keys=True, default=_to_json) + "\n")
+        self._file.flush()
+        self._last.update(values)
+        self.steps += 1
+        self._unsynced += 1
+        if (
+            self._unsynced >= self.fsync_every
+            or time.monotonic() - self._last_fsync >= self.fsync_seconds
+        ):
+            self.flush(fsync=True)
+
+    def flush(self, fsync: bool = False) -> None:
+        if self._file is None:
+            return
+        self._file.flush()
+        now = time.monotonic()
+        if fsync or now - self._last_fsync >= self.fsync_seconds:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+            self._last_fsync = now
+
+    def close(self) -> None:
+        self.flush(fsync=True)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def summary(self) -> dict[str, Any]:
+        return json.loads(json.dumps(self._last, default=_to_json))
+
+    def __enter__(self) -> "MetricsWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def read_metrics_log(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open() as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import json
+import os
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from omegaconf import OmegaConf
+from truthweave.utils import ensure_dir, write_text_atomic
+from truthweave.yaml_loader import load_yaml
 
-from truthweave.utils import ensure_dir, write_json
+CONFIG_NAME = "truthweave.yml"
+INDEX_VERSION = 1
+_PRUNED_PAPER_DIRS = {"auto", "build"}
 
 
 def _default_paper_config() -> dict[str, Any]:
@@ -38,55 +44,208 @@ def _merge_defaults(defaults: dict[str, Any], data: dict[str, Any]) -> dict[str,
     return merged
 
 
-def load_paper_config(path: Path) -> dict[str, Any]:
-    cfg = OmegaConf.load(path)
-    data = OmegaConf.to_container(cfg, resolve=True)
+_STR_FIELDS = ("paper_id", "engine", "main", "bib")
+_MAPPING_FIELDS = ("paths", "style", "build", "inputs")
+
+
+@dataclass(slots=True)
+class PaperConfig:
+    paper_id: str = ""
+    engine: str = "latexmk"
+    main: str = "main.tex"
+    bib: str = "refs.bib"
+    paths: dict[str, str] = field(default_factory=dict)
+    style: dict[str, Any] = field(default_factory=dict)
+    build: dict[str, Any] = field(default_factory=dict)
+    inputs: dict[str, Any] = field(default_factory=dict)
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], source: Path) -> "PaperConfig":
+        merged = _merge_defaults(_default_paper_config(), data)
+        if merged["paper_id"] is None:
+            merged["paper_id"] = ""
+        problems = [
+            f"{key} must be a string"
+            for key in _STR_FIELDS
+            if not isinstance(merged[key], str)
+        ]
+        problems += [
+            f"{key} must be a mapping"
+            for key in _MAPPING_FIELDS
+            if not isinstance(merged[key], dict)
+        ]
+        if isinstance(merged["paths"], dict):
+            problems += [
+                f"paths.{key} must be a string"
+                for key, value in merged["paths"].items()
+                if not isinstance(value, str)
+            ]
+        if problems:
+            raise SystemExit(
+                f"Invalid truthweave.yml at {source}: " + "; ".join(problems)
+            )
+        known = {*_STR_FIELDS, *_MAPPING_FIELDS}
+        return cls(
+            **{key: merged[key] for key in known},
+            extra={key: value for key, value in merged.items() if key not in known},
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {key: getattr(self, key) for key in (*_STR_FIELDS, *_MAPPING_FIELDS)}
+        data.update(self.extra)
+        return data
+
+
+def load_paper_config(path: Path) -> PaperConfig:
+    data = load_yaml(path)
     if not isinstance(data, dict):
         raise SystemExit(f"Invalid truthweave.yml at {path}")
-    merged = _merge_defaults(_default_paper_config(), data)
-    return merged
+    return PaperConfig.from_dict(data, path)
 
 
-def discover_papers(repo_root: Path) -> dict[str, Any]:
+def index_path(repo_root: Path) -> Path:
+    return repo_root / "artifacts" / "manifests" / "papers_index.json"
+
+
+def _load_index(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    cache = data.get("cache")
+    if not isinstance(cache, dict) or cache.get("version") != INDEX_VERSION:
+        return {}
+    return data
+
+
+def _dirs_unchanged(repo_root: Path, dirs: dict[str, int]) -> bool:
+    if not dirs:
+        return False
+    for rel, mtime_ns in dirs.items():
+        try:
+            if os.stat(repo_root / rel).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _walk_configs(
+    repo_root: Path, papers_dir: Path
+) -> tuple[list[str], dict[str, int]]:
+    config_paths: list[str] = []
+    dirs: dict[str, int] = {}
+    stack = [papers_dir]
+    while stack:
+        current = stack.pop()
+        try:
+            mtime_ns = os.stat(current).st_mtime_ns
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        rel_dir = current.relative_to(repo_root).as_posix()
+        dirs[rel_dir] = mtime_ns
+        pruned: set[str] = set()
+        if any(entry.name == CONFIG_NAME for entry in entries):
+            config_paths.append(f"{rel_dir}/{CONFIG_NAME}")
+            pruned = _PRUNED_PAPER_DIRS
+        for entry in entries:
+            if entry.name in pruned or not entry.is_dir(follow_symlinks=False):
+                continue
+            stack.append(Path(entry.path))
+    return sorted(config_paths), dirs
+
+
+def discover_paper_configs(
+    repo_root: Path,
+) -> tuple[dict[str, Any], dict[str, PaperConfig]]:
     papers_dir = repo_root / "papers"
+    generated_at = datetime.now(timezone.utc).isoformat()
     if not papers_dir.exists():
-        return {"papers": [], "generated_at": datetime.now(timezone.utc).isoformat()}
+        return {"papers": [], "generated_at": generated_at}, {}
+
+    path = index_path(repo_root)
+    previous = _load_index(path)
+    cache = previous.get("cache", {})
+    cached_configs = cache.get("configs", {})
+    dirs = cache.get("dirs", {})
+    if _dirs_unchanged(repo_root, dirs):
+        config_paths = sorted(cached_configs)
+    else:
+        config_paths, dirs = _walk_configs(repo_root, papers_dir)
 
     entries = []
-    for config_path in sorted(papers_dir.rglob("truthweave.yml")):
-        paper_dir = config_path.parent
-        config = load_paper_config(config_path)
-        paper_id = config.get("paper_id") or paper_dir.name
-        main = config.get("main", "main.tex")
-        engine = config.get("engine", "latexmk")
-        bib = config.get("bib", "refs.bib")
+    configs = {}
+    records = {}
+    for rel in config_paths:
+        config_path = repo_root / rel
+        try:
+            st = config_path.stat()
+        except FileNotFoundError:
+            continue
+        record = cached_configs.get(rel)
+        if (
+            record is not None
+            and record.get("mtime_ns") == st.st_mtime_ns
+            and record.get("size") == st.st_size
+        ):
+            config = PaperConfig.from_dict(record["config"], config_path)
+        else:
+            config = load_paper_config(config_path)
+        records[rel] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "config": config.to_dict(),
+        }
 
+        paper_dir = config_path.parent
+        paper_id = config.paper_id or paper_dir.name
         entries.append(
             {
                 "paper_id": paper_id,
                 "path": str(paper_dir.relative_to(repo_root)),
-                "engine": engine,
-                "main": main,
-                "bib": bib,
+                "engine": config.engine,
+                "main": config.main,
+                "bib": config.bib,
             }
         )
+        configs[paper_id] = config
 
     entries.sort(key=lambda item: item["paper_id"])
-    return {"papers": entries, "generated_at": datetime.now(timezone.utc).isoformat()}
+    if previous.get("papers") == entries and previous.get("generated_at"):
+        generated_at = previous["generated_at"]
+    manifest = {"papers": entries, "generated_at": generated_at}
+
+    index = {
+        **manifest,
+        "cache": {"version": INDEX_VERSION, "dirs": dirs, "configs": records},
+    }
+    ensure_dir(path.parent)
+    write_text_atomic(path, json.dumps(index, indent=2, sort_keys=True))
+    return manifest, configs
+
+
+def discover_papers(repo_root: Path) -> dict[str, Any]:
+    manifest, _ = discover_paper_configs(repo_root)
+    return manifest
 
 
 def write_discovery_manifest(repo_root: Path) -> Path:
+    discover_paper_configs(repo_root)
+    return index_path(repo_root)
+
+
+def paper_index(repo_root: Path) -> dict[str, dict[str, Any]]:
     manifest = discover_papers(repo_root)
-    out_dir = repo_root / "artifacts" / "manifests"
-    ensure_dir(out_dir)
-    out_path = out_dir / "papers_index.json"
-    write_json(out_path, manifest)
-    return out_path
+    return {paper["paper_id"]: paper for paper in manifest["papers"]}
 
 
 def get_paper_by_id(repo_root: Path, paper_id: str) -> dict[str, Any]:
-    manifest = discover_papers(repo_root)
-    for paper in manifest["papers"]:
-        if paper["paper_id"] == paper_id:
-            return paper
-    raise SystemExit(f"Unknown paper_id '{paper_id}'. Run paperops discover.")
+    paper = paper_index(repo_root).get(paper_id)
+    if paper is None:
+        raise SystemExit(f"Unknown paper_id '{paper_id}'. Run paperops discover.")
+    return paper
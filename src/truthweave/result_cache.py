@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import stat
+from pathlib import Path
+from typing import Any
+
+from omegaconf import OmegaConf
+
+from truthweave.utils import ensure_dir, link_or_copy, write_json
+
+RESULT_FILES = ["metrics.json", "metrics.jsonl"]
+RESULT_DIRS = ["artifacts"]
+HIT_RECORD = "result_cache.json"
+_COMPLETE = ".complete"
+_WRITABLE = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+
+def _clean_commit(git_commit_path: Path) -> str | None:
+    if not git_commit_path.exists():
+        return None
+    lines = git_commit_path.read_text().splitlines()
+    if len(lines) < 2 or lines[1].strip() != "clean":
+        return None
+    commit = lines[0].strip()
+    if len(commit) != 40 or any(c not in "0123456789abcdef" for c in commit):
+        return None
+    return commit
+
+
+def cache_key(cfg: Any, experiment_cls: type, git_commit_path: Path) -> str | None:
+    commit = _clean_commit(git_commit_path)
+    if commit is None:
+        return None
+    source_file = inspect.getsourcefile(experiment_cls)
+    if source_file is None:
+        return None
+
+    config = OmegaConf.to_container(cfg, resolve=True)
+    if isinstance(config, dict):
+        config.pop("cache", None)
+        experiment = config.get("experiment")
+        if isinstance(experiment, dict):
+            experiment.pop("output_subdir", None)
+
+    h = hashlib.sha256()
+    h.update(json.dumps(config, sort_keys=True, default=str).encode())
+    h.update(Path(source_file).read_bytes())
+    h.update(commit.encode())
+    return h.hexdigest()
+
+
+def _share_tree(src: Path, dst: Path) -> None:
+    ensure_dir(dst)
+    for entry in src.iterdir():
+        target = dst / entry.name
+        if entry.is_dir():
+            _share_tree(entry, target)
+        elif entry.stat().st_mode & _WRITABLE:
+            shutil.copy2(entry, target)
+        else:
+            link_or_copy(entry, target)
+
+
+def _entry_size(entry: Path) -> int:
+    return sum(p.stat().st_size for p in entry.rglob("*") if p.is_file())
+
+
+class ResultCache:
+    def __init__(self, root: Path, max_bytes: int | None = None) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def lookup(self, key: str) -> Path | None:
+        entry = self.root / key
+        if not (entry / _COMPLETE).exists():
+            return None
+        os.utime(entry)
+        return entry
+
+    def materialize(self, entry: Path, run_dir: Path) -> None:
+        for name in RESULT_FILES:
+            if (entry / name).exists():
+                shutil.copy2(entry / name, run_dir / name)
+        for name in RESULT_DIRS:
+            if (entry / name).is_dir():
+                _share_tree(entry / name, run_dir / name)
+        source = json.loads((entry / _COMPLETE).read_text())
+        write_json(
+            run_dir / HIT_RECORD,
+            {"key": entry.name, "source_run": source.get("run_id")},
+        )
+
+    def store(self, key: str, run_dir: Path) -> None:
+        entry = self.root / key
+        if entry.exists():
+            return
+        ensure_dir(self.root)
+        tmp_entry = self.root / f".{key}.{os.getpid()}.tmp"
+        if tmp_entry.exists():
+            shutil.rmtree(tmp_entry)
+        ensure_dir(tmp_entry)
+        for name in RESULT_FILES:
+            if (run_dir / name).exists():
+                shutil.copy2(run_dir / name, tmp_entry / name)
+        for name in RESULT_DIRS:
+            if (run_dir / name).is_dir():
+                _share_tree(run_dir / name, tmp_entry / name)
+        write_json(tmp_entry / _COMPLETE, {"run_id": run_dir.name})
+        try:
+            os.replace(tmp_entry, entry)
+        except OSError:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+        self.evict()
+
+    def evict(self) -> list[Path]:
+        if self.max_bytes is None or not self.root.exists():
+            return []
+        entries = [
+            p for p in self.root.iterdir() if p.is_dir() and not p.name.startswith(".")
+        ]
+        entries.sort(key=lambda p: p.stat().st_mtime)
+        sizes = {entry: _entry_size(entry) for entry in entries}
+        total = sum(sizes.values())
+        evicted = []
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= sizes[entry]
+            evicted.append(entry)
+        return evicted
+
+
+def result_cache_for(repo_root: Path, cfg: Any) -> ResultCache | None:
+    if not OmegaConf.select(cfg, "cache.results", default=True):
+        return None
+    max_size_mb = OmegaConf.select(cfg, "cache.max_size_mb", default=None)
+    max_bytes = None if max_size_mb is None else int(max_size_mb) * 1024 * 1024
+    return ResultCache(repo_root / "artifacts" / "cache" / "results", max_bytes)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+from truthweave.utils import ensure_dir
+
+INDEX_NAME = "runs_index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    experiment TEXT,
+    mtime REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_mtime ON runs (mtime);
+CREATE INDEX IF NOT EXISTS runs_by_experiment ON runs (experiment, mtime);
+"""
+
+
+@dataclass
+class RunRecord:
+    run_id: str
+    experiment: str | None
+    mtime: float
+
+
+def default_index_path(runs_dir: Path) -> Path:
+    return runs_dir.parent / "artifacts" / "manifests" / INDEX_NAME
+
+
+def _connect(index_path: Path) -> sqlite3.Connection:
+    ensure_dir(index_path.parent)
+    conn = sqlite3.connect(str(index_path), timeout=30.0)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _experiment_from_config(run_dir: Path) -> str | None:
+    import yaml
+
+    config_path = run_dir / "config_resolved.yaml"
+    if not config_path.exists():
+        return None
+    try:
+        data = yaml.safe_load(config_path.read_text())
+    except yaml.YAMLError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    experiment = data.get("experiment")
+    if not isinstance(experiment, dict):
+        return None
+    name = experiment.get("name")
+    return str(name) if name is not None else None
+
+
+def record_run(
+    run_dir: Path, experiment: str | None, index_path: Path | None = None
+) -> None:
+    if index_path is None:
+        index_path = default_index_path(run_dir.parent)
+    mtime = run_dir.stat().st_mtime
+    with closing(_connect(index_path)) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO runs (run_id, experiment, mtime) VALUES (?, ?, ?)",
+            (run_dir.name, experiment, mtime),
+        )
+
+
+def forget_run(run_id: str, index_path: Path) -> None:
+    with closing(_connect(index_path)) as conn, conn:
+        conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+
+
+def _row(run_dir: Path) -> tuple[str, str | None, float]:
+    return (run_dir.name, _experiment_from_config(run_dir), run_dir.stat().st_mtime)
+
+
+def _run_ids(runs_dir: Path) -> set[str]:
+    if not runs_dir.exists():
+        return set()
+    with os.scandir(runs_dir) as it:
+        return {entry.name for entry in it if entry.is_dir()}
+
+
+def rebuild_index(runs_dir: Path, index_path: Path | None = None) -> int:
+    if index_path is None:
+        index_path = default_index_path(runs_dir)
+    rows = [_row(runs_dir / run_id) for run_id in _run_ids(runs_dir)]
+    with closing(_connect(index_path)) as conn, conn:
+        conn.execute("DELETE FROM runs")
+        conn.executemany(
+            "INSERT INTO runs (run_id, experiment, mtime) VALUES (?, ?, ?)", rows
+        )
+    return len(rows)
+
+
+def backfill_index(runs_dir: Path, index_path: Path | None = None) -> int:
+    if index_path is None:
+        index_path = default_index_path(runs_dir)
+    run_ids = _run_ids(runs_dir)
+    with closing(_connect(index_path)) as conn, conn:
+        run_ids.difference_update(
+            row[0] for row in conn.execute("SELECT run_id FROM runs")
+        )
+        rows = [_row(runs_dir / run_id) for run_id in sorted(run_ids)]
+        conn.executemany(
+            "INSERT INTO runs (run_id, experiment, mtime) VALUES (?, ?, ?)", rows
+        )
+    return len(rows)
+
+
+def _query(index_path: Path, sql: str, params: tuple) -> list[RunRecord]:
+    with closing(_connect(index_path)) as conn:
+        rows = conn.execute(sql, params).fetchall()
+    return [RunRecord(run_id=r[0], experiment=r[1], mtime=r[2]) for r in rows]
+
+
+def latest_run(
+    runs_dir: Path, experiment: str | None = None, index_path: Path | None = None
+) -> Path | None:
+    if index_path is None:
+        index_path = default_index_path(runs_dir)
+    if experiment is None:
+        sql = "SELECT run_id, experiment, mtime FROM runs ORDER BY mtime DESC LIMIT 1"
+        params: tuple = ()
+    else:
+        sql = (
+            "SELECT run_id, experiment, mtime FROM runs WHERE experiment = ? "
+            "ORDER BY mtime DESC LIMIT 1"
+        )
+        params = (experiment,)
+    while True:
+        records = _query(index_path, sql, params)
+        if not records:
+            return None
+        run_dir = runs_dir / records[0].run_id
+        if run_dir.is_dir():
+            return run_dir
+        forget_run(records[0].run_id, index_path)
+
+
+def runs_by_experiment(
+    runs_dir: Path, experiment: str, index_path: Path | None = None
+) -> list[RunRecord]:
+    if index_path is None:
+        index_path = default_index_path(runs_dir)
+    return _query(
+        index_path,
+        "SELECT run_id, experiment, mtime FROM runs WHERE experiment = ? "
+        "ORDER BY mtime",
+        (experiment,),
+    )
+
+
+def runs_between(
+    runs_dir: Path,
+    start: float | None = None,
+    end: float | None = None,
+    index_path: Path | None = None,
+) -> list[RunRecord]:
+    if index_path is None:
+        index_path = default_index_path(runs_dir)
+    return _query(
+        index_path,
+        "SELECT run_id, experiment, mtime FROM runs WHERE mtime >= ? AND mtime < ? "
+        "ORDER BY mtime",
+        (
+            float("-inf") if start is None else start,
+            float("inf") if end is None else end,
+        ),
+    )
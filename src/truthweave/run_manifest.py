@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+from truthweave.hashcache import HashCache, digest_file, hash_cache_for
+from truthweave.utils import write_json
+
+RUN_MANIFEST = "RUN_MANIFEST.json"
+MANIFEST_VERSION = 1
+
+_worker_cache: HashCache | None = None
+
+
+@dataclass
+class RunVerification:
+    run_id: str
+    has_manifest: bool = True
+    files: int = 0
+    problems: list[str] = field(default_factory=list)
+
+
+def _iter_files(run_dir: Path) -> Iterator[tuple[str, Path]]:
+    for dirpath, dirnames, filenames in os.walk(run_dir):
+        dirnames.sort()
+        base = Path(dirpath)
+        for name in sorted(filenames):
+            path = base / name
+            rel = path.relative_to(run_dir).as_posix()
+            if rel == RUN_MANIFEST or name.endswith(".tmp"):
+                continue
+            yield rel, path
+
+
+def build_manifest(run_dir: Path, cache: HashCache | None = None) -> dict[str, Any]:
+    files = {}
+    for rel, path in _iter_files(run_dir):
+        size = path.stat().st_size
+        files[rel] = {"sha256": digest_file(path, size, cache), "size": size}
+    return {"version": MANIFEST_VERSION, "files": files}
+
+
+def write_manifest(run_dir: Path, cache: HashCache | None = None) -> dict[str, Any]:
+    manifest = build_manifest(run_dir, cache)
+    write_json(run_dir / RUN_MANIFEST, manifest)
+    return manifest
+
+
+def verify_run(run_dir: Path, cache: HashCache | None = None) -> RunVerification:
+    result = RunVerification(run_id=run_dir.name)
+    if not run_dir.is_dir():
+        result.problems.append("run directory is missing")
+        return result
+    manifest_path = run_dir / RUN_MANIFEST
+    if not manifest_path.exists():
+        result.has_manifest = False
+        return result
+    try:
+        expected = json.loads(manifest_path.read_text())["files"]
+    except (ValueError, KeyError, TypeError):
+        result.problems.append(f"unreadable {RUN_MANIFEST}")
+        return result
+
+    result.files = len(expected)
+    present = dict(_iter_files(run_dir))
+    for rel, entry in expected.items():
+        path = present.pop(rel, None)
+        if path is None:
+            result.problems.append(f"missing {rel}")
+            continue
+        size = path.stat().st_size
+        if size != entry["size"]:
+            result.problems.append(f"size changed {rel} ({entry['size']} -> {size})")
+        elif digest_file(path, size, cache) != entry["sha256"]:
+            result.problems.append(f"modified {rel}")
+    result.problems.extend(f"untracked {rel}" for rel in present)
+    return result
+
+
+def _worker_init(repo_root: str | None) -> None:
+    global _worker_cache
+    if repo_root is None:
+        _worker_cache = None
+        return
+    _worker_cache = hash_cache_for(Path(repo_root))
+    _worker_cache.preload()
+
+
+def _verify_worker(run_dir: str) -> RunVerification:
+    return verify_run(Path(run_dir), _worker_cache)
+
+
+def verify_runs(
+    run_dirs: list[Path], repo_root: Path | None = None, jobs: int | None = None
+) -> list[RunVerification]:
+    root = None if repo_root is None else str(repo_root)
+    work = [str(run_dir) for run_dir in run_dirs]
+    if jobs == 1 or len(work) <= 1:
+        _worker_init(root)
+        return [_verify_worker(run_dir) for run_dir in work]
+    workers = jobs or os.cpu_count() or 1
+    chunksize = max(1, min(256, len(work) // (workers * 4)))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_worker_init, initargs=(root,)
+    ) as pool:
+        return list(pool.map(_verify_worker, work, chunksize=chunksize))
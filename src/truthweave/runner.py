@@ -1,21 +1,43 @@
 from __future__ import annotations
 
 import json
+import os
 import random
+import shutil
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from omegaconf import OmegaConf
 
-from truthweave import snapshot
+from truthweave import run_index, snapshot
+from truthweave.arrays import array_path, save_array
+from truthweave.cas import BlobStore
+from truthweave.metrics import METRICS_LOG, MetricsWriter
+from truthweave.result_cache import ResultCache, cache_key
+from truthweave.run_manifest import write_manifest
 from truthweave.utils import ensure_dir, write_json
 
+if TYPE_CHECKING:
+    from truthweave.hashcache import HashCache
+
 
 class BaseExperiment(ABC):
     def __init__(self, cfg: Any, run_dir: Path) -> None:
         self.cfg = cfg
         self.run_dir = run_dir
+        self.metrics: MetricsWriter | None = None
+        self.runner: ExperimentRunner | None = None
+
+    def save_artifact(self, src: Path, name: str | None = None) -> Path:
+        if self.runner is None:
+            raise RuntimeError("save_artifact needs an ExperimentRunner")
+        return self.runner.save_artifact(src, name)
+
+    def save_array(self, name: str, array: Any, **meta: Any) -> Path:
+        if self.runner is None:
+            raise RuntimeError("save_array needs an ExperimentRunner")
+        return self.runner.save_array(name, array, **meta)
 
     @abstractmethod
     def setup(self) -> None:
@@ -31,36 +53,94 @@ class BaseExperiment(ABC):
 
 
 class ExperimentRunner:
-    def __init__(self, cfg: Any, run_dir: Path, experiment: BaseExperiment) -> None:
+    def __init__(
+        self,
+        cfg: Any,
+        run_dir: Path,
+        experiment: BaseExperiment,
+        snapshot_cache_dir: Path | None = None,
+        shared_snapshot_dir: Path | None = None,
+        argv: list[str] | None = None,
+        result_cache: ResultCache | None = None,
+        hash_cache: HashCache | None = None,
+        blob_store: BlobStore | None = None,
+    ) -> None:
         self.cfg = cfg
         self.run_dir = run_dir
         self.experiment = experiment
+        self.snapshot_cache_dir = snapshot_cache_dir
+        self.shared_snapshot_dir = shared_snapshot_dir
+        self.argv = argv
+        self.result_cache = result_cache
+        self.hash_cache = hash_cache
+        self.blob_store = blob_store
 
     def _seed_all(self) -> dict[str, int]:
         seed = int(self.cfg.runtime.seed)
         random.seed(seed)
         return {"python": seed}
 
+    def save_artifact(self, src: Path, name: str | None = None) -> Path:
+        dst = self.run_dir / "artifacts" / (name or src.name)
+        if not dst.exists() or not dst.samefile(src):
+            ensure_dir(dst.parent)
+            tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+            shutil.copy2(src, tmp)
+            os.replace(tmp, dst)
+        return dst
+
+    def save_array(self, name: str, array: Any, **meta: Any) -> Path:
+        path = array_path(self.run_dir / "artifacts", name)
+        save_array(path, array, **meta)
+        return path
+
     def run(self) -> dict[str, Any]:
         ensure_dir(self.run_dir)
         ensure_dir(self.run_dir / "artifacts")
 
         seeds = self._seed_all()
-        snapshot.save_config_resolved(self.run_dir, self.cfg)
-        snapshot.save_git_status(self.run_dir)
-        snapshot.save_command(self.run_dir)
-        snapshot.save_env_freeze(self.run_dir)
-        snapshot.save_hardware_info(self.run_dir)
-        snapshot.save_seeds(self.run_dir, seeds)
-
-        self.experiment.setup()
+        snapshot.save_all(
+            self.run_dir,
+            self.cfg,
+            seeds,
+            cache_dir=self.snapshot_cache_dir,
+            shared_dir=self.shared_snapshot_dir,
+            argv=self.argv,
+        )
+
+        metrics_path = self.run_dir / "metrics.json"
+        key = None
+        if self.result_cache is not None:
+            key = cache_key(
+                self.cfg, type(self.experiment), self.run_dir / "git_commit.txt"
+            )
+            entry = self.result_cache.lookup(key) if key else None
+            if entry is not None:
+                self.result_cache.materialize(entry, self.run_dir)
+                write_manifest(self.run_dir, self.hash_cache)
+                run_index.record_run(self.run_dir, str(self.cfg.experiment.name))
+                return json.loads(metrics_path.read_text())
+
+        metrics_log = MetricsWriter(self.run_dir / METRICS_LOG)
+        self.experiment.metrics = metrics_log
+        self.experiment.runner = self
         try:
-            metrics = self.experiment.run()
+            self.experiment.setup()
+            try:
+                returned = self.experiment.run()
+            finally:
+                self.experiment.teardown()
         finally:
-            self.experiment.teardown()
+            metrics_log.close()
 
-        metrics_path = self.run_dir / "metrics.json"
+        metrics = {**metrics_log.summary(), **(returned or {})}
         write_json(metrics_path, metrics)
+        if self.blob_store is not None:
+            self.blob_store.absorb(self.run_dir / "artifacts", self.hash_cache)
+        if self.result_cache is not None and key:
+            self.result_cache.store(key, self.run_dir)
+        write_manifest(self.run_dir, self.hash_cache)
+        run_index.record_run(self.run_dir, str(self.cfg.experiment.name))
         return metrics
 
 
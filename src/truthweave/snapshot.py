@@ -1,15 +1,54 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import platform
+import shutil
 import subprocess
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-import psutil
-from omegaconf import OmegaConf
+from omegaconf import DictConfig, OmegaConf
 
-from truthweave.utils import write_json
+from truthweave import hardware
+from truthweave.utils import link_or_copy, write_json
+
+
+def host_id() -> str:
+    return f"{platform.node()}-{uuid.getnode():012x}"
+
+
+def snapshot_cache_dir(cache_root: Path, lock_path: Path) -> Path | None:
+    if not lock_path.exists():
+        return None
+    h = hashlib.sha256(lock_path.read_bytes())
+    h.update(host_id().encode())
+    h.update(sys.executable.encode())
+    return cache_root / h.hexdigest()[:32]
+
+
+def _restore_cached(cache_dir: Path | None, name: str, target: Path) -> bool:
+    if cache_dir is None:
+        return False
+    cached = cache_dir / name
+    if not cached.exists():
+        return False
+    shutil.copyfile(cached, target)
+    return True
+
+
+def _store_cached(cache_dir: Path | None, name: str, source: Path) -> None:
+    if cache_dir is None:
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_dir / f".{name}.{os.getpid()}.tmp"
+    shutil.copyfile(source, tmp_path)
+    os.replace(tmp_path, cache_dir / name)
 
 
 def save_config_resolved(run_dir: Path, cfg: Any) -> None:
@@ -48,39 +87,84 @@ def save_command(run_dir: Path, argv: list[str] | None = None) -> None:
     path.write_text(" ".join(argv) + "\n")
 
 
-def save_env_freeze(run_dir: Path) -> None:
-    output = _run_capture(["uv", "pip", "freeze"]) or "uv pip freeze failed"
+def save_env_freeze(run_dir: Path, cache_dir: Path | None = None) -> None:
     path = run_dir / "env_freeze.txt"
-    path.write_text(output + "\n")
-
-
-def save_hardware_info(run_dir: Path) -> None:
-    info: dict[str, Any] = {
-        "platform": platform.platform(),
-        "uname": platform.uname()._asdict(),
-        "cpu_count_logical": psutil.cpu_count(logical=True),
-        "cpu_count_physical": psutil.cpu_count(logical=False),
-        "memory_total_bytes": psutil.virtual_memory().total,
-    }
-
-    gpu_info = _run_capture(
-        [
-            "nvidia-smi",
-            "--query-gpu=name,memory.total,driver_version",
-            "--format=csv,noheader,nounits",
-        ]
-    )
-    info["gpu"] = [line.strip() for line in gpu_info.splitlines() if line.strip()]
-
-    try:
-        import torch
-
-        info["cuda_version"] = torch.version.cuda
-    except Exception:
-        info["cuda_version"] = None
-
-    write_json(run_dir / "hardware.json", info)
+    if _restore_cached(cache_dir, "env_freeze.txt", path):
+        return
+    output = _run_capture(["uv", "pip", "freeze"])
+    path.write_text((output or "uv pip freeze failed") + "\n")
+    if output:
+        _store_cached(cache_dir, "env_freeze.txt", path)
+
+
+def hardware_probes(cfg: Any) -> list[str] | None:
+    setting = OmegaConf.select(cfg, "logging.save_hardware_snapshot", default=True)
+    if isinstance(setting, DictConfig):
+        probes = setting.get("probes")
+        return None if probes is None else [str(name) for name in probes]
+    if not setting:
+        return []
+    return None
+
+
+def save_hardware_info(
+    run_dir: Path, cache_dir: Path | None = None, probes: list[str] | None = None
+) -> None:
+    selected = hardware.DEFAULT_PROBES if probes is None else probes
+    key = hashlib.sha256(",".join(selected).encode()).hexdigest()[:12]
+    cache_name = f"hardware-{key}.json"
+    if _restore_cached(cache_dir, cache_name, run_dir / "hardware.json"):
+        return
+    write_json(run_dir / "hardware.json", hardware.collect(selected))
+    _store_cached(cache_dir, cache_name, run_dir / "hardware.json")
 
 
 def save_seeds(run_dir: Path, seed_dict: dict[str, int]) -> None:
     write_json(run_dir / "seeds.json", seed_dict)
+
+
+SHARED_SNAPSHOTS = ["git_commit.txt", "env_freeze.txt", "hardware.json"]
+
+
+def save_shared(shared_dir: Path, cfg: Any, cache_dir: Path | None = None) -> None:
+    tasks = [
+        partial(save_git_status, shared_dir),
+        partial(save_env_freeze, shared_dir, cache_dir),
+        partial(save_hardware_info, shared_dir, cache_dir, hardware_probes(cfg)),
+    ]
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = [pool.submit(task) for task in tasks]
+    for future in futures:
+        future.result()
+
+
+def link_shared(shared_dir: Path, run_dir: Path) -> None:
+    for name in SHARED_SNAPSHOTS:
+        link_or_copy(shared_dir / name, run_dir / name)
+
+
+def save_all(
+    run_dir: Path,
+    cfg: Any,
+    seed_dict: dict[str, int],
+    cache_dir: Path | None = None,
+    shared_dir: Path | None = None,
+    argv: list[str] | None = None,
+) -> None:
+    tasks = [
+        partial(save_config_resolved, run_dir, cfg),
+        partial(save_command, run_dir, argv),
+        partial(save_seeds, run_dir, seed_dict),
+    ]
+    if shared_dir is None:
+        tasks += [
+            partial(save_git_status, run_dir),
+            partial(save_env_freeze, run_dir, cache_dir),
+            partial(save_hardware_info, run_dir, cache_dir, hardware_probes(cfg)),
+        ]
+    else:
+        tasks.append(partial(link_shared, shared_dir, run_dir))
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = [pool.submit(task) for task in tasks]
+    for future in futures:
+        future.result()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from omegaconf import OmegaConf
+
+from truthweave import snapshot
+from truthweave.cas import BlobStore, blob_store_for
+from truthweave.compose import compose_many, expand_sweep
+from truthweave.registry import get_experiment_class
+from truthweave.result_cache import ResultCache, result_cache_for
+from truthweave.runner import ExperimentRunner
+from truthweave.utils import ensure_dir
+
+
+@dataclass
+class SweepJob:
+    cfg: Any
+    run_dir: Path
+    argv: list[str]
+
+
+def _worker_init() -> None:
+    from truthweave import experiments  # noqa: F401
+
+
+def _run_job(
+    job: SweepJob,
+    shared_dir: Path,
+    result_cache: ResultCache | None,
+    blob_store: BlobStore | None,
+) -> Path:
+    experiment_cls = get_experiment_class(job.cfg.experiment.name)
+    experiment = experiment_cls(job.cfg, job.run_dir)
+    runner = ExperimentRunner(
+        job.cfg,
+        job.run_dir,
+        experiment,
+        shared_snapshot_dir=shared_dir,
+        argv=job.argv,
+        result_cache=result_cache,
+        blob_store=blob_store,
+    )
+    runner.run()
+    return job.run_dir
+
+
+def plan_sweep(repo_root: Path, overrides: list[str]) -> list[SweepJob]:
+    override_sets = expand_sweep(overrides)
+    cfgs = compose_many(repo_root / "conf", override_sets)
+    jobs = []
+    for idx, (override_set, cfg) in enumerate(zip(override_sets, cfgs)):
+        resolved = OmegaConf.create(OmegaConf.to_container(cfg, resolve=True))
+        subdir = f"{resolved.experiment.output_subdir}_{idx:03d}"
+        OmegaConf.update(resolved, "experiment.output_subdir", subdir)
+        run_dir = repo_root / resolved.project.runs_dir / subdir
+        argv = [sys.argv[0], "run", *override_set]
+        jobs.append(SweepJob(cfg=resolved, run_dir=run_dir, argv=argv))
+    return jobs
+
+
+def run_sweep(
+    repo_root: Path,
+    overrides: list[str],
+    max_workers: int | None = None,
+    snapshot_cache_dir: Path | None = None,
+    use_cache: bool = True,
+) -> list[tuple[SweepJob, BaseException | None]]:
+    jobs = plan_sweep(repo_root, overrides)
+    if not jobs:
+        return []
+
+    sweep_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    shared_dir = repo_root / "artifacts" / "cache" / "sweeps" / sweep_id
+    ensure_dir(shared_dir)
+    snapshot.save_shared(shared_dir, jobs[0].cfg, snapshot_cache_dir)
+    result_cache = result_cache_for(repo_root, jobs[0].cfg) if use_cache else None
+    blob_store = blob_store_for(repo_root, jobs[0].cfg)
+
+    results: list[tuple[SweepJob, BaseException | None]] = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_worker_init
+    ) as pool:
+        futures = [
+            pool.submit(_run_job, job, shared_dir, result_cache, blob_store)
+            for job in jobs
+        ]
+        for job, future in zip(jobs, futures):
+            error = future.exception()
+            results.append((job, error))
+    return results
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import shutil
+import threading
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from truthweave.hashcache import HashCache
 
 
 def ensure_dir(path: Path) -> None:
@@ -14,17 +20,41 @@ def write_json(path: Path, data: Any) -> None:
     path.write_text(json.dumps(data, indent=2, sort_keys=True))
 
 
-def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
+def write_text_atomic(path: Path, text: str) -> bool:
+    data = text.encode()
+    if path.exists() and path.read_bytes() == data:
+        return False
+    tmp_path = path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def sha256_file(path: Path, cache: HashCache | None = None) -> str:
+    if cache is not None:
+        return cache.digest(path)
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def find_latest_run(runs_dir: Path) -> Path | None:
     if not runs_dir.exists():
         return None
+    from truthweave import run_index
+
+    index_path = run_index.default_index_path(runs_dir)
+    if index_path.exists():
+        run_index.backfill_index(runs_dir, index_path)
+        return run_index.latest_run(runs_dir, index_path=index_path)
     run_dirs = [p for p in runs_dir.iterdir() if p.is_dir()]
     if not run_dirs:
         return None
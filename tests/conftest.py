@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+from omegaconf import OmegaConf
+
+from truthweave import snapshot
+from truthweave.runner import BaseExperiment, ExperimentRunner
+
+Body = Callable[[BaseExperiment], dict[str, Any] | None]
+
+
+class FunctionExperiment(BaseExperiment):
+    body: Body
+
+    def setup(self) -> None:
+        pass
+
+    def run(self) -> dict[str, Any] | None:
+        return self.body(self)
+
+    def teardown(self) -> None:
+        pass
+
+
+@pytest.fixture
+def run_experiment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Callable[..., Path]:
+    monkeypatch.setattr(snapshot, "_run_capture", lambda cmd: "")
+
+    def run(body: Body, run_id: str = "run1", seed: int = 1, **runner: Any) -> Path:
+        run_dir = tmp_path / "runs" / run_id
+        cfg = OmegaConf.create(
+            {
+                "runtime": {"seed": seed},
+                "experiment": {"name": body.__name__, "output_subdir": run_id},
+            }
+        )
+        experiment = FunctionExperiment(cfg, run_dir)
+        experiment.body = body
+        ExperimentRunner(cfg, run_dir, experiment, **runner).run()
+        return run_dir
+
+    return run
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from truthweave.analysis import aggregate
+
+
+def _write_run(runs_dir: Path, run_id: str, n: int, mean: float, seed: int) -> None:
+    run_dir = runs_dir / run_id
+    run_dir.mkdir(parents=True)
+    (run_dir / "metrics.json").write_text(json.dumps({"mean": mean, "n": n}))
+    (run_dir / "config_resolved.yaml").write_text(
+        f"experiment:\n  name: example\nexample:\n  n: {n}\n  tags: [a, b]\n"
+    )
+    (run_dir / "seeds.json").write_text(json.dumps({"python": seed}))
+
+
+def test_aggregate_appends_new_runs_and_groups(tmp_path: Path) -> None:
+    runs_dir = tmp_path / "runs"
+    table_path = tmp_path / "runs_table.twt"
+    _write_run(runs_dir, "r1", 10, 0.25, 1)
+    _write_run(runs_dir, "r2", 10, 0.75, 2)
+    _write_run(runs_dir, "r3", 20, 0.5, 1)
+    (runs_dir / "in_progress").mkdir()
+
+    table, added, dropped = aggregate.aggregate(runs_dir, table_path)
+    assert (added, dropped, table.n_rows) == (3, 0, 3)
+    assert table.group_by(["config.example.n"], "metrics.mean") == {
+        (10.0,): 0.5,
+        (20.0,): 0.5,
+    }
+    assert table.group_by(["seeds.python"], "metrics.mean", "count") == {
+        (1.0,): 2.0,
+        (2.0,): 1.0,
+    }
+
+    _write_run(runs_dir, "r4", 20, 1.5, 3)
+    shutil.rmtree(runs_dir / "r1")
+    table, added, dropped = aggregate.aggregate(runs_dir, table_path)
+    assert (added, dropped) == (1, 1)
+
+    loaded = aggregate.load_table(table_path)
+    assert sorted(loaded.run_ids()) == ["r2", "r3", "r4"]
+    assert loaded.column("config.example.tags") == ['["a", "b"]'] * 3
+    assert loaded.group_by(["config.example.n"], "metrics.mean", "max") == {
+        (10.0,): 0.75,
+        (20.0,): 1.5,
+    }
+
+
+def test_aggregate_rereads_rewritten_runs(tmp_path: Path) -> None:
+    runs_dir = tmp_path / "runs"
+    table_path = tmp_path / "runs_table.twt"
+    _write_run(runs_dir, "r1", 10, 0.5, 1)
+    aggregate.aggregate(runs_dir, table_path)
+
+    (runs_dir / "r1" / "metrics.json").write_text(json.dumps({"mean": 0.9, "n": 100}))
+    table, added, dropped = aggregate.aggregate(runs_dir, table_path)
+    assert (added, dropped) == (1, 1)
+    assert table.column("metrics.mean") == [0.9]
+
+    table, added, dropped = aggregate.aggregate(runs_dir, table_path)
+    assert (added, dropped) == (0, 0)
+    assert aggregate.load_table(table_path).column("metrics.mean") == [0.9]
+
+
+def test_numeric_column_widens_to_strings(tmp_path: Path) -> None:
+    table = aggregate.RunTable()
+    table.append_rows([{"run_id": "a", "x": 1}, {"run_id": "b"}])
+    table.append_rows([{"run_id": "c", "x": "high"}])
+    assert table.column("x") == ["1", None, "high"]
+
+    path = tmp_path / "t.twt"
+    aggregate.save_table(table, path)
+    assert aggregate.load_table(path).columns == table.columns
+    with pytest.raises(SystemExit):
+        table.group_by(["run_id"], "x")
+
+
+def test_group_by_and_paper_aggregations_share_reducers(tmp_path: Path) -> None:
+    from truthweave.aggregations import reduce_values
+
+    runs_dir = tmp_path / "runs"
+    for idx, mean in enumerate([0.1, 0.4, 0.2, 0.9]):
+        _write_run(runs_dir, f"r{idx}", 10, mean, idx)
+    table, _, _ = aggregate.aggregate(runs_dir, tmp_path / "table.twt")
+    values = [0.1, 0.4, 0.2, 0.9]
+    for name in ["count", "mean", "std", "min", "max", "sum", "median", "quantile:0.9"]:
+        grouped = table.group_by(["config.example.n"], "metrics.mean", name)
+        assert grouped == {(10.0,): reduce_values(values, [name])[name]}
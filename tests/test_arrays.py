@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from truthweave.analysis.arrays import ArrayRef, iter_run_arrays, run_arrays
+from truthweave.cas import BlobStore
+from truthweave.runner import BaseExperiment
+
+np = pytest.importorskip("numpy")
+
+
+def embed(experiment: BaseExperiment) -> dict[str, Any]:
+    seed = int(experiment.cfg.runtime.seed)
+    embeddings = np.arange(4000, dtype=np.float32).reshape(1000, 4) * seed
+    experiment.save_array("embeddings", embeddings, split="test")
+    experiment.save_array("preds/labels", np.ones(1000, dtype=np.int64))
+    return {"rows": 1000}
+
+
+def test_saved_arrays_load_memory_mapped(
+    tmp_path: Path, run_experiment: Callable[..., Path]
+) -> None:
+    store = BlobStore(tmp_path / "artifacts" / "cas")
+    run_dir = run_experiment(embed, blob_store=store)
+
+    sidecar = json.loads(
+        (run_dir / "artifacts" / "embeddings.npy.json").read_text()
+    )
+    assert sidecar == {
+        "shape": [1000, 4],
+        "dtype": "<f4",
+        "nbytes": 16000,
+        "meta": {"split": "test"},
+    }
+
+    arrays = run_arrays(run_dir)
+    assert sorted(arrays) == ["embeddings", "preds/labels"]
+    ref = arrays["embeddings"]
+    assert ref._data is None
+    rows = ref[10:12]
+    assert isinstance(ref.data, np.memmap)
+    assert np.shares_memory(rows, ref.data)
+    assert rows.tolist() == [[40, 41, 42, 43], [44, 45, 46, 47]]
+
+
+def test_iter_run_arrays_streams_chunks_across_runs(
+    tmp_path: Path, run_experiment: Callable[..., Path]
+) -> None:
+    store = BlobStore(tmp_path / "artifacts" / "cas")
+    for run_id, seed in [("a", 1), ("b", 2), ("c", 1)]:
+        run_experiment(embed, run_id, seed, blob_store=store)
+
+    totals = {
+        run_id: sum(float(chunk.sum()) for chunk in ref.iter_chunks(rows=128))
+        for run_id, ref in iter_run_arrays(tmp_path / "runs", "embeddings")
+    }
+    expected = float(np.arange(4000).sum())
+    assert totals == {"a": expected, "b": 2 * expected, "c": expected}
+    assert len(list((tmp_path / "artifacts" / "cas").glob("*/*"))) == 5
+
+
+def test_open_without_sidecar_raises(tmp_path: Path) -> None:
+    path = tmp_path / "preds.npy"
+    np.save(path, np.zeros(3))
+    with pytest.raises(FileNotFoundError, match="preds.npy.json"):
+        ArrayRef.open(path)
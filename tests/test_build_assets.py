@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from truthweave import cli
+from truthweave.cli import build_paper_assets_command, create_paper_command
+
+
+def _setup_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("TRUTHWEAVE_REPO_ROOT", str(tmp_path))
+    run_dir = tmp_path / "runs" / "run1"
+    run_dir.mkdir(parents=True)
+    (run_dir / "metrics.json").write_text(json.dumps({"best_accuracy": 0.91234}))
+    create_paper_command("paper1", None, None)
+    return tmp_path / "papers" / "paper1" / "auto"
+
+
+def test_build_assets_skips_unchanged_sources(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    auto_dir = _setup_repo(tmp_path, monkeypatch)
+
+    build_paper_assets_command("paper1")
+    variables = auto_dir / "variables.tex"
+    manifest = auto_dir / "MANIFEST.json"
+    assert variables.read_text() == "\\newcommand{\\MetricBestAccuracy}{0.9123}\n"
+    mtimes = (variables.stat().st_mtime_ns, manifest.stat().st_mtime_ns)
+    capsys.readouterr()
+
+    build_paper_assets_command("paper1")
+    assert "paper1: skipped" in capsys.readouterr().out
+    assert (variables.stat().st_mtime_ns, manifest.stat().st_mtime_ns) == mtimes
+
+
+def test_build_assets_regenerates_when_metrics_change(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    auto_dir = _setup_repo(tmp_path, monkeypatch)
+    build_paper_assets_command("paper1")
+
+    metrics_path = tmp_path / "runs" / "run1" / "metrics.json"
+    metrics_path.write_text(json.dumps({"best_accuracy": 0.5}))
+    capsys.readouterr()
+    build_paper_assets_command("paper1")
+
+    assert "paper1: regenerated" in capsys.readouterr().out
+    assert "{0.5}" in (auto_dir / "variables.tex").read_text()
+
+
+def test_build_assets_all_discovers_once(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _setup_repo(tmp_path, monkeypatch)
+    create_paper_command("paper2", None, None)
+
+    calls = []
+    original = cli.discover_papers
+
+    def counting_discover(repo_root: Path) -> dict:
+        calls.append(repo_root)
+        return original(repo_root)
+
+    monkeypatch.setattr(cli, "discover_papers", counting_discover)
+    capsys.readouterr()
+    build_paper_assets_command(None, all_papers=True, jobs=2)
+
+    output = capsys.readouterr().out
+    assert "paper1: regenerated" in output
+    assert "paper2: regenerated" in output
+    assert len(calls) == 1
+    for paper_id in ["paper1", "paper2"]:
+        assert (tmp_path / "papers" / paper_id / "auto" / "MANIFEST.json").exists()
+
+
+def test_build_assets_batch_resolves_sources_once(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _setup_repo(tmp_path, monkeypatch)
+    create_paper_command("paper2", None, None)
+    create_paper_command("paper3", None, None)
+
+    calls = []
+    original = cli._resolve_metrics_source
+
+    def counting_resolve(repo_root: Path, source: str | None) -> Path:
+        calls.append(source)
+        return original(repo_root, source)
+
+    original_build = cli._build_paper_assets
+
+    def failing_build(paper_id: str, *args, **kwargs) -> str:
+        if paper_id == "paper2":
+            raise RuntimeError("boom")
+        return original_build(paper_id, *args, **kwargs)
+
+    monkeypatch.setattr(cli, "_resolve_metrics_source", counting_resolve)
+    monkeypatch.setattr(cli, "_build_paper_assets", failing_build)
+    capsys.readouterr()
+    with pytest.raises(SystemExit):
+        build_paper_assets_command(None, all_papers=True, jobs=3)
+
+    output = capsys.readouterr().out
+    assert "paper1: regenerated" in output
+    assert "paper2: failed (boom)" in output
+    assert "paper3: regenerated" in output
+    assert len(calls) == 1
+
+
+def _write_seed_run(tmp_path: Path, run_id: str, seed: int, acc: float) -> None:
+    run_dir = tmp_path / "runs" / run_id
+    run_dir.mkdir(parents=True)
+    (run_dir / "metrics.json").write_text(json.dumps({"best_accuracy": acc}))
+    (run_dir / "config_resolved.yaml").write_text(
+        f"experiment:\n  name: example\nruntime:\n  seed: {seed}\n"
+    )
+
+
+def test_build_assets_emits_aggregation_macros(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    auto_dir = _setup_repo(tmp_path, monkeypatch)
+    (tmp_path / "conf").mkdir()
+    (tmp_path / "conf" / "pipeline.yaml").write_text(
+        "assets:\n"
+        "  aggregations:\n"
+        "    - name: seed_acc\n"
+        "      metric: best_accuracy\n"
+        "      experiment: example\n"
+        "      reduce: [mean, std, max, 'quantile:0.5']\n"
+    )
+    for seed, acc in [(1, 0.8), (2, 0.9), (3, 1.0)]:
+        _write_seed_run(tmp_path, f"seed{seed}", seed, acc)
+
+    build_paper_assets_command("paper1")
+    variables = (auto_dir / "variables.tex").read_text()
+    assert "\\newcommand{\\AggSeedAccMean}{0.9}" in variables
+    assert "\\newcommand{\\AggSeedAccStd}{0.0816}" in variables
+    assert "\\newcommand{\\AggSeedAccMax}{1}" in variables
+    assert "\\newcommand{\\AggSeedAccQFiveZero}{0.9}" in variables
+    manifest = json.loads((auto_dir / "MANIFEST.json").read_text())
+    (record,) = manifest["source"]["aggregations"]
+    assert [run["run_id"] for run in record["runs"]] == ["seed1", "seed2", "seed3"]
+    assert all(len(run["metrics_json_sha256"]) == 64 for run in record["runs"])
+
+    capsys.readouterr()
+    build_paper_assets_command("paper1")
+    assert "paper1: skipped" in capsys.readouterr().out
+
+    _write_seed_run(tmp_path, "seed4", 4, 0.5)
+    build_paper_assets_command("paper1")
+    assert "paper1: regenerated" in capsys.readouterr().out
+    assert "\\AggSeedAccMean}{0.8}" in (auto_dir / "variables.tex").read_text()
+
+    (tmp_path / "runs" / "seed4" / "metrics.json").write_text(
+        json.dumps({"best_accuracy": 0.9})
+    )
+    build_paper_assets_command("paper1")
+    assert "paper1: regenerated" in capsys.readouterr().out
+    assert "\\AggSeedAccMean}{0.9}" in (auto_dir / "variables.tex").read_text()
+
+
+def test_freshness_check_follows_aggregated_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from truthweave.checks import check_paper_freshness
+
+    _setup_repo(tmp_path, monkeypatch)
+    (tmp_path / "conf").mkdir()
+    (tmp_path / "conf" / "pipeline.yaml").write_text(
+        "assets:\n"
+        "  aggregations:\n"
+        "    - name: seed_acc\n"
+        "      metric: best_accuracy\n"
+        "      experiment: example\n"
+    )
+    for seed, acc in [(1, 0.8), (2, 0.9)]:
+        _write_seed_run(tmp_path, f"seed{seed}", seed, acc)
+    build_paper_assets_command("paper1")
+    paper_dir = tmp_path / "papers" / "paper1"
+
+    def check() -> list:
+        return check_paper_freshness.check(tmp_path, paper_dir, "paper1", "ci")
+
+    assert check() == []
+    seed1 = tmp_path / "runs" / "seed1" / "metrics.json"
+    seed1.write_text(json.dumps({"best_accuracy": 0.1}))
+    (issue,) = check()
+    assert issue.category == "FRESHNESS"
+    assert str(seed1) in issue.paths
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from truthweave import cli
+from truthweave.cli import build_paper_command, create_paper_command
+
+
+def test_build_paper_all_reports_failures(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TRUTHWEAVE_REPO_ROOT", str(tmp_path))
+    create_paper_command("good", None, None)
+    create_paper_command("bad", None, None)
+
+    def fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        kwargs["stdout"].write(f"building {cmd[-1]}\n")
+        if "bad" in cmd[-1]:
+            raise subprocess.CalledProcessError(12, cmd)
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(cli.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit):
+        build_paper_command(None, all_papers=True, jobs=2)
+
+    output = capsys.readouterr().out
+    assert "[built] good" in output
+    assert "[failed (exit 12)] bad" in output
+    assert "Built 1/2 papers" in output
+    log = tmp_path / "papers" / "good" / "build" / "build.log"
+    assert "building" in log.read_text()
+
+
+def test_build_paper_all_survives_unexpected_errors(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TRUTHWEAVE_REPO_ROOT", str(tmp_path))
+    create_paper_command("good", None, None)
+    create_paper_command("broken", None, None)
+    original = cli._build_paper
+
+    def build(paper_id: str, *args: Any) -> str:
+        if paper_id == "broken":
+            raise OSError("no space left")
+        return original(paper_id, *args)
+
+    monkeypatch.setattr(cli.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(
+        cli.subprocess, "run", lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 0)
+    )
+    monkeypatch.setattr(cli, "_build_paper", build)
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit):
+        build_paper_command(None, all_papers=True, jobs=2)
+
+    output = capsys.readouterr().out
+    assert "[failed (no space left)] broken" in output
+    assert "Built 1/2 papers" in output
+    (row,) = [line for line in output.splitlines() if line.startswith("broken ")]
+    assert row.split()[-1] == "-"
+    assert "papers/good/build/build.log" in output
+
+
+def test_build_paper_skips_unchanged_inputs(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TRUTHWEAVE_REPO_ROOT", str(tmp_path))
+    create_paper_command("paper1", None, None)
+    calls: list[list[str]] = []
+
+    pdf = tmp_path / "papers" / "paper1" / "build" / "main.pdf"
+
+    def fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        calls.append(cmd)
+        pdf.write_bytes(b"%PDF")
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(cli.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+
+    build_paper_command("paper1")
+    build_paper_command("paper1")
+    assert len(calls) == 1
+    assert "paper1: up to date" in capsys.readouterr().out
+
+    (tmp_path / "papers" / "paper1" / "auto" / "variables.tex").write_text("x")
+    build_paper_command("paper1")
+    assert len(calls) == 2
+
+    build_paper_command("paper1", force=True)
+    assert len(calls) == 3
+
+    pdf.unlink()
+    build_paper_command("paper1")
+    assert len(calls) == 4
+
+
+def test_build_paper_rebuilds_when_shared_style_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TRUTHWEAVE_REPO_ROOT", str(tmp_path))
+    create_paper_command("paper1", None, None)
+    paper_dir = tmp_path / "papers" / "paper1"
+    config_path = paper_dir / "truthweave.yml"
+    config = yaml.safe_load(config_path.read_text())
+    config["style"]["TEXINPUTS"] = ["styles", "../../shared/styles", "."]
+    config_path.write_text(yaml.safe_dump(config))
+    style = tmp_path / "shared" / "styles" / "lab.sty"
+    style.parent.mkdir(parents=True)
+    style.write_text("% v1\n")
+    calls: list[list[str]] = []
+
+    def fake_run(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+        calls.append(cmd)
+        (paper_dir / "build" / "main.pdf").write_bytes(b"%PDF")
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(cli.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(cli.subprocess, "run", fake_run)
+
+    build_paper_command("paper1")
+    build_paper_command("paper1")
+    assert len(calls) == 1
+
+    style.write_text("% v2\n")
+    build_paper_command("paper1")
+    assert len(calls) == 2
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from truthweave.cas import BlobStore
+from truthweave.cli import gc_command
+from truthweave.run_manifest import verify_run
+from truthweave.runner import BaseExperiment
+
+
+def checkpoint(experiment: BaseExperiment) -> dict[str, Any]:
+    artifacts = experiment.run_dir / "artifacts"
+    (artifacts / "model.bin").write_bytes(b"weights" * 1000)
+    experiment.save_artifact(_dataset(experiment), "data/train.bin")
+    return {"loss": 0.1}
+
+
+def rewrite_dataset(experiment: BaseExperiment) -> dict[str, Any]:
+    saved = experiment.save_artifact(_dataset(experiment), "data/train.bin")
+    saved.write_bytes(b"rewritten")
+    return {"loss": 0.2}
+
+
+def _dataset(experiment: BaseExperiment) -> Path:
+    return experiment.run_dir.parents[1] / "dataset.bin"
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> BlobStore:
+    (tmp_path / "dataset.bin").write_bytes(b"rows" * 1000)
+    return BlobStore(tmp_path / "artifacts" / "cas")
+
+
+def _blobs(store: BlobStore) -> list[Path]:
+    return sorted(store.root.glob("*/*"))
+
+
+def test_identical_artifacts_share_one_blob(
+    tmp_path: Path, store: BlobStore, run_experiment: Callable[..., Path]
+) -> None:
+    first = run_experiment(checkpoint, "a", blob_store=store)
+    second = run_experiment(checkpoint, "b", blob_store=store)
+
+    assert len(_blobs(store)) == 2
+    for name in ["model.bin", "data/train.bin"]:
+        assert (first / "artifacts" / name).samefile(second / "artifacts" / name)
+    assert (first / "artifacts" / "data" / "train.bin").read_bytes() == b"rows" * 1000
+    assert not (first / "artifacts" / "model.bin").stat().st_mode & 0o222
+    dataset = (tmp_path / "dataset.bin").stat()
+    assert dataset.st_nlink == 1
+    assert dataset.st_mode & 0o200
+    assert verify_run(second).problems == []
+
+
+def test_saved_artifacts_are_private_until_the_run_ends(
+    store: BlobStore, run_experiment: Callable[..., Path]
+) -> None:
+    first = run_experiment(checkpoint, "a", blob_store=store)
+    run_dir = run_experiment(rewrite_dataset, "b", blob_store=store)
+
+    assert (first / "artifacts" / "data" / "train.bin").read_bytes() == b"rows" * 1000
+    assert (run_dir / "artifacts" / "data" / "train.bin").read_bytes() == b"rewritten"
+    assert verify_run(first).problems == []
+
+
+def test_put_replaces_a_blob_modified_in_place(
+    store: BlobStore, run_experiment: Callable[..., Path]
+) -> None:
+    first = run_experiment(checkpoint, "a", blob_store=store)
+    model = first / "artifacts" / "model.bin"
+    model.chmod(0o644)
+    model.write_bytes(b"corrupt" * 1000)
+
+    second = run_experiment(checkpoint, "b", blob_store=store)
+
+    assert (second / "artifacts" / "model.bin").read_bytes() == b"weights" * 1000
+    assert verify_run(second).problems == []
+    assert verify_run(first).problems == ["modified artifacts/model.bin"]
+
+
+def test_gc_removes_only_unreferenced_blobs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    store: BlobStore,
+    run_experiment: Callable[..., Path],
+) -> None:
+    monkeypatch.setenv("TRUTHWEAVE_REPO_ROOT", str(tmp_path))
+    run_experiment(checkpoint, "a", blob_store=store)
+    run_experiment(checkpoint, "b", blob_store=store)
+
+    shutil.rmtree(tmp_path / "runs" / "a")
+    assert store.gc(grace_seconds=0)["removed"] == 0
+
+    shutil.rmtree(tmp_path / "runs" / "b")
+    gc_command(grace_seconds=3600, dry_run=False)
+    assert "Removed 0 unreferenced blobs" in capsys.readouterr().out
+    gc_command(grace_seconds=0, dry_run=True)
+    assert "Would remove 2 unreferenced blobs" in capsys.readouterr().out
+    assert len(_blobs(store)) == 2
+    gc_command(grace_seconds=0, dry_run=False)
+    assert _blobs(store) == []
+
+
+def test_store_recovers_when_gc_removes_the_blob(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path / "cas")
+    src = tmp_path / "src.bin"
+    src.write_bytes(b"payload")
+    put = store.put
+    calls = []
+
+    def racing_put(*args: Any) -> str:
+        digest = put(*args)
+        calls.append(digest)
+        if len(calls) == 1:
+            store.blob_path(digest).unlink()
+        return digest
+
+    store.put = racing_put  # type: ignore[method-assign]
+    dst = tmp_path / "run" / "artifacts" / "src.bin"
+    digest = store.store(src, dst)
+    assert len(calls) == 2
+    assert dst.samefile(store.blob_path(digest))
+    assert dst.read_bytes() == b"payload"
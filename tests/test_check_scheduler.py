@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from truthweave.checks.models import Issue
+from truthweave.checks.scheduler import CheckTask, run_checks
+
+
+def _issue(name: str) -> Issue:
+    return Issue(
+        category="TEST",
+        severity="WARN",
+        message=name,
+        fix=None,
+        recheck=None,
+        paths=[],
+    )
+
+
+def _sleepy(name: str, delay: float):
+    def fn() -> list[Issue]:
+        time.sleep(delay)
+        return [_issue(name)]
+
+    return fn
+
+
+def test_results_keep_submission_order() -> None:
+    tasks = [
+        CheckTask("slow", _sleepy("slow", 0.3)),
+        CheckTask("fast", _sleepy("fast", 0.0)),
+        CheckTask("medium", _sleepy("medium", 0.2)),
+    ]
+    start = time.perf_counter()
+    results = run_checks(tasks, jobs=3)
+    elapsed = time.perf_counter() - start
+
+    assert [r.name for r in results] == ["slow", "fast", "medium"]
+    assert [r.issues[0].message for r in results] == ["slow", "fast", "medium"]
+    assert elapsed < 0.45
+
+
+def test_timed_out_check_reports_fail_issue() -> None:
+    release = threading.Event()
+
+    def hang() -> list[Issue]:
+        release.wait(5)
+        return []
+
+    tasks = [
+        CheckTask("hang", hang, timeout=0.1),
+        CheckTask("ok", _sleepy("ok", 0.0), timeout=1.0),
+    ]
+    start = time.perf_counter()
+    results = run_checks(tasks, jobs=1, recheck="uv run truthweave check")
+    release.set()
+
+    assert time.perf_counter() - start < 1.0
+    assert results[0].timed_out
+    assert results[0].issues[0].category == "CHECK_TIMEOUT"
+    assert results[0].issues[0].severity == "FAIL"
+    assert results[1].issues[0].message == "ok"
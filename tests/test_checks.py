@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import time
 from hashlib import sha256
 from pathlib import Path
 
@@ -8,7 +9,7 @@ import pytest
 from omegaconf import OmegaConf
 
 from truthweave.cli import check_command, create_exp_command
-from truthweave.checks import check_structure
+from truthweave.checks import check_no_manual_numbers, check_structure
 
 
 def _write_file(path: Path, content: str) -> None:
@@ -138,3 +139,104 @@ def test_create_exp_scaffold(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) ->
 
     assert (tmp_path / "conf" / "exp" / "myexp.yaml").exists()
     assert (tmp_path / "src" / "truthweave" / "experiments" / "myexp.py").exists()
+
+
+def test_check_loads_each_paper_config_once(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from truthweave import papers
+    from truthweave.checks import check_paper_freshness
+
+    _setup_min_repo(tmp_path)
+    _setup_paper(tmp_path, "paper1", stale_manifest=False)
+    monkeypatch.setenv("TRUTHWEAVE_REPO_ROOT", str(tmp_path))
+
+    loads: list[Path] = []
+    original = papers.load_paper_config
+
+    def counting_load(path: Path) -> papers.PaperConfig:
+        loads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(papers, "load_paper_config", counting_load)
+    monkeypatch.setattr(check_paper_freshness, "load_paper_config", counting_load)
+
+    check_command(None, mode="dev", profile=True)
+    output = capsys.readouterr().out
+    assert len(loads) == 1
+    assert "[profile] check_paper_freshness[paper1]" in output
+
+
+def test_manual_numbers_follows_inputs_and_skips_auto(tmp_path: Path) -> None:
+    paper_dir = tmp_path / "paper"
+    _write_file(
+        paper_dir / "main.tex",
+        "\\input{sections/intro}\n\\input{auto/variables.tex}\n"
+        "% 9.99 in a comment\n\\input{sections/intro}\n",
+    )
+    _write_file(
+        paper_dir / "sections" / "intro.tex",
+        "Clean line\nAccuracy was 0.93 and 0.94\n"
+        "Allowed 1.5 % truthweave-allow-number\n",
+    )
+    _write_file(paper_dir / "auto" / "variables.tex", "\\newcommand{\\Acc}{0.93}\n")
+
+    issues = check_no_manual_numbers.check(paper_dir / "main.tex", "ci", "p")
+
+    assert [issue.paths for issue in issues] == [
+        [f"{paper_dir / 'sections' / 'intro.tex'}:2"]
+    ]
+    assert issues[0].severity == "FAIL"
+
+
+def test_manual_numbers_reports_in_document_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paper_dir = tmp_path / "paper"
+    _write_file(paper_dir / "main.tex", "\\input{a}\n\\input{b}\n")
+    _write_file(paper_dir / "a.tex", "\\input{c}\n")
+    _write_file(paper_dir / "b.tex", "\\input{d}\n")
+    _write_file(paper_dir / "c.tex", "c was 1.5\n")
+    _write_file(paper_dir / "d.tex", "d was 2.5\n")
+
+    original = check_no_manual_numbers._scan_file
+
+    def slow_scan(path: Path) -> tuple[list[tuple[int, str]], list[str]]:
+        if path.name == "a.tex":
+            time.sleep(0.2)
+        return original(path)
+
+    monkeypatch.setattr(check_no_manual_numbers, "_scan_file", slow_scan)
+    found = check_no_manual_numbers.scan(paper_dir / "main.tex")
+    assert [path.name for path, _, _ in found] == ["c.tex", "d.tex"]
+
+
+def test_structure_scan_prunes_skipped_dirs_and_depth(tmp_path: Path) -> None:
+    _setup_min_repo(tmp_path)
+    (tmp_path / "src" / "truthweave" / "experiments").mkdir()
+    (tmp_path / "runs" / "run1" / "experiments").mkdir()
+    (tmp_path / "src" / "truthweave" / "data" / "analysis").mkdir(parents=True)
+    (tmp_path / "src" / "truthweave" / "__pycache__" / "analysis").mkdir(parents=True)
+    deep = tmp_path / "tests" / "a" / "b" / "c" / "d" / "e" / "f" / "g" / "analysis"
+    deep.mkdir(parents=True)
+    (tmp_path / "runs" / "run1" / "artifacts" / "analysis").mkdir(parents=True)
+    (tmp_path / "data" / "raw" / "dump" / "experiments").mkdir(parents=True)
+
+    issues = check_structure.check(tmp_path, mode="ci")
+
+    assert len(issues) == 1
+    assert sorted(issues[0].paths) == [
+        "Unexpected analysis dir: src/truthweave/data/analysis",
+        "Unexpected experiments dir: runs/run1/experiments",
+    ]
+
+    _write_file(
+        tmp_path / "conf" / "repo_contract.yml",
+        "rules:\n  scan_skip_dirs: [/runs, /data/raw, __pycache__]\n",
+    )
+    (tmp_path / "src" / "truthweave" / "runs" / "experiments").mkdir(parents=True)
+    issues = check_structure.check(tmp_path, mode="ci")
+    assert sorted(issues[0].paths) == [
+        "Unexpected analysis dir: src/truthweave/data/analysis",
+        "Unexpected experiments dir: src/truthweave/runs/experiments",
+    ]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import hydra
+import pytest
+from omegaconf import OmegaConf
+
+from truthweave import compose
+
+CONF_DIR = Path(__file__).resolve().parents[1] / "conf"
+
+
+def test_compose_each_applies_deltas_to_one_base(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[list[str]] = []
+    original = hydra.compose
+
+    def counting_compose(config_name: str, overrides: list[str]) -> object:
+        calls.append(list(overrides))
+        return original(config_name=config_name, overrides=overrides)
+
+    override_sets = [["exp=example", f"example.n={n}"] for n in range(5)]
+    override_sets.append(["exp=example", "example.missing=1"])
+    monkeypatch.setattr(compose.hydra, "compose", counting_compose)
+    results = compose.compose_each(CONF_DIR, override_sets)
+    monkeypatch.undo()
+
+    assert calls == [["exp=example"]]
+    assert [result.cfg.example.n for result in results[:5]] == list(range(5))
+    assert results[5].cfg is None
+    assert "Could not override 'example.missing'" in results[5].error
+
+    with hydra.initialize_config_dir(config_dir=str(CONF_DIR), version_base=None):
+        expected = hydra.compose(config_name="base", overrides=override_sets[3])
+    assert OmegaConf.to_container(results[3].cfg) == OmegaConf.to_container(expected)
+
+
+def test_compose_each_matches_hydra_for_add_and_delete_overrides() -> None:
+    override_sets = [
+        ["exp=example", "++example.extra=3", "example.n=5"],
+        ["exp=example", "~example.n"],
+        ["exp=example", "+example.n=3"],
+    ]
+    results = compose.compose_each(CONF_DIR, override_sets)
+
+    with hydra.initialize_config_dir(config_dir=str(CONF_DIR), version_base=None):
+        for overrides, result in zip(override_sets[:2], results):
+            expected = hydra.compose(config_name="base", overrides=overrides)
+            assert OmegaConf.to_container(result.cfg) == OmegaConf.to_container(
+                expected
+            )
+    assert "Could not append to config" in results[2].error
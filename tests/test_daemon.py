@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def _env(repo_root: Path, socket_path: Path) -> dict[str, str]:
+    return {
+        **os.environ,
+        "PYTHONPATH": str(SRC_DIR),
+        "TRUTHWEAVE_REPO_ROOT": str(repo_root),
+        "TRUTHWEAVE_SOCKET": str(socket_path),
+    }
+
+
+def _cli(env: dict[str, str], *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-c", "from truthweave.entry import main; main()", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+
+
+def test_serve_forwards_commands_with_exit_codes(tmp_path: Path) -> None:
+    paper_dir = tmp_path / "papers" / "p1"
+    paper_dir.mkdir(parents=True)
+    (paper_dir / "truthweave.yml").write_text("paper_id: p1\n")
+    socket_path = tmp_path / "tw.sock"
+    env = _env(tmp_path, socket_path)
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from truthweave.cli import main; main()",
+            "serve",
+            "--socket",
+            str(socket_path),
+        ],
+        env={key: value for key, value in env.items() if key != "TRUTHWEAVE_SOCKET"},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not socket_path.exists():
+            assert server.poll() is None, server.stderr.read()
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+
+        index = tmp_path / "artifacts" / "manifests" / "papers_index.json"
+        index.unlink()
+        code = (
+            "from pathlib import Path\n"
+            "from truthweave import daemon\n"
+            f"print(daemon.forward(Path({str(socket_path)!r}), ['discover']))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env
+        )
+        assert result.stdout.strip() == "0"
+        assert index.exists()
+
+        result = _cli(env, "check", "--paper", "missing")
+        assert result.returncode == 1
+        assert "Unknown paper_id 'missing'" in result.stderr
+
+        result = _cli(env, "build-paper-assets", "--bogus")
+        assert result.returncode == 2
+        assert "unrecognized arguments: --bogus" in result.stderr
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    assert not socket_path.exists()
+
+
+def test_client_runs_locally_without_server(tmp_path: Path) -> None:
+    (tmp_path / "papers").mkdir()
+    result = _cli(_env(tmp_path, tmp_path / "missing.sock"), "discover")
+    assert result.returncode == 0
+    assert (tmp_path / "artifacts" / "manifests" / "papers_index.json").exists()
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from truthweave import hashcache
+from truthweave.hashcache import HashCache
+from truthweave.utils import sha256_file
+
+
+def test_hash_cache_reuses_digest_for_unchanged_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "metrics.json"
+    target.write_text('{"a": 1}')
+    db_path = tmp_path / "cache" / "hashes.sqlite"
+
+    first = HashCache(db_path).digest(target)
+    assert first == hashlib.sha256(target.read_bytes()).hexdigest()
+
+    def fail(path: Path) -> str:
+        raise AssertionError("file was re-read")
+
+    monkeypatch.setattr(hashcache, "sha256_file", fail)
+    assert HashCache(db_path).digest(target) == first
+
+
+def test_hash_cache_detects_changes(tmp_path: Path) -> None:
+    target = tmp_path / "metrics.json"
+    target.write_text('{"a": 1}')
+    cache = HashCache(tmp_path / "hashes.sqlite")
+    before = sha256_file(target, cache)
+
+    target.write_text('{"a": 22}')
+    after = sha256_file(target, cache)
+
+    assert before != after
+    assert after == sha256_file(target)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from truthweave.metrics import METRICS_LOG, MetricsWriter, read_metrics_log
+from truthweave.runner import BaseExperiment
+
+
+def stepping(fail_at: int | None = None) -> Callable[[BaseExperiment], dict[str, Any]]:
+    def steps(experiment: BaseExperiment) -> dict[str, Any]:
+        for step in range(10):
+            if step == fail_at:
+                raise RuntimeError("boom")
+            experiment.metrics.log(loss=1.0 / (step + 1), lr=0.1)
+        return {"status": "ok", "lr": 0.01}
+
+    return steps
+
+
+def test_writer_fsyncs_in_batches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    synced: list[int] = []
+    monkeypatch.setattr(os, "fsync", synced.append)
+    path = tmp_path / METRICS_LOG
+    writer = MetricsWriter(path, fsync_every=4, fsync_seconds=3600)
+    for step in range(10):
+        writer.log(step=step, loss=float(step))
+    assert len(path.read_text().splitlines()) == 10
+    assert len(synced) == 2
+    writer.close()
+    assert len(synced) == 3
+
+    records = list(read_metrics_log(path))
+    assert [record["step"] for record in records] == list(range(10))
+    assert writer.summary() == {"loss": 9.0}
+
+
+def test_records_reach_the_file_without_close(tmp_path: Path) -> None:
+    path = tmp_path / METRICS_LOG
+    writer = MetricsWriter(path, fsync_every=1000, fsync_seconds=0.05)
+    for step in range(3):
+        writer.log(step=step, loss=float(step))
+    time.sleep(0.1)
+    assert [record["step"] for record in read_metrics_log(path)] == [0, 1, 2]
+    writer.close()
+
+
+def test_runner_builds_summary_from_metrics_log(
+    run_experiment: Callable[..., Path],
+) -> None:
+    run_dir = run_experiment(stepping())
+
+    metrics = json.loads((run_dir / "metrics.json").read_text())
+    assert metrics == {"loss": 0.1, "lr": 0.01, "status": "ok"}
+    assert len(list(read_metrics_log(run_dir / METRICS_LOG))) == 10
+
+
+def test_metrics_log_survives_a_crash(
+    tmp_path: Path, run_experiment: Callable[..., Path]
+) -> None:
+    with pytest.raises(RuntimeError):
+        run_experiment(stepping(fail_at=5))
+
+    run_dir = tmp_path / "runs" / "run1"
+    assert not (run_dir / "metrics.json").exists()
+    assert len(list(read_metrics_log(run_dir / METRICS_LOG))) == 5
@@ -7,6 +7,7 @@ import pytest
 from omegaconf import OmegaConf
 
 from truthweave.cli import create_paper_command, discover_command
+from truthweave import papers
 from truthweave.papers import load_paper_config
 from truthweave.checks import check_structure
 
@@ -38,7 +39,7 @@ def test_create_paper_creates_structure() -> None:
         assert (paper_dir / "refs.bib").exists()
         assert (paper_dir / "styles" / ".gitkeep").exists()
         cfg = load_paper_config(paper_dir / "truthweave.yml")
-        assert cfg["paper_id"] == paper_id
+        assert cfg.paper_id == paper_id
     finally:
         _cleanup_paper(paper_id)
 
@@ -81,7 +82,7 @@ def test_create_paper_clone() -> None:
         assert (new_dir / "styles" / "style.sty").exists()
         assert not (new_dir / "auto" / "generated.txt").exists()
         cfg = load_paper_config(new_dir / "truthweave.yml")
-        assert cfg["paper_id"] == new_id
+        assert cfg.paper_id == new_id
     finally:
         _cleanup_paper(base_id)
         _cleanup_paper(new_id)
@@ -117,3 +118,61 @@ def test_check_structure_detects_stray_top_level(tmp_path: Path) -> None:
     issues = check_structure.check(tmp_path, mode="ci")
     assert issues
     assert issues[0].category == "STRUCTURE"
+
+
+def test_discovery_reparses_only_changed_configs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for paper_id in ["p1", "p2"]:
+        paper_dir = tmp_path / "papers" / paper_id
+        paper_dir.mkdir(parents=True)
+        (paper_dir / "truthweave.yml").write_text(f"paper_id: {paper_id}\n")
+    papers.discover_papers(tmp_path)
+
+    parsed = []
+    original = papers.load_paper_config
+
+    def counting_load(path: Path) -> papers.PaperConfig:
+        parsed.append(path.parent.name)
+        return original(path)
+
+    monkeypatch.setattr(papers, "load_paper_config", counting_load)
+    assert papers.get_paper_by_id(tmp_path, "p2")["path"] == "papers/p2"
+    assert parsed == []
+
+    (tmp_path / "papers" / "p1" / "truthweave.yml").write_text(
+        "paper_id: p1\nengine: tectonic\n"
+    )
+    (tmp_path / "papers" / "p3").mkdir()
+    (tmp_path / "papers" / "p3" / "truthweave.yml").write_text("paper_id: p3\n")
+    manifest = papers.discover_papers(tmp_path)
+
+    assert sorted(parsed) == ["p1", "p3"]
+    assert [p["paper_id"] for p in manifest["papers"]] == ["p1", "p2", "p3"]
+    assert papers.get_paper_by_id(tmp_path, "p1")["engine"] == "tectonic"
+
+
+def test_load_yaml_matches_omegaconf(tmp_path: Path) -> None:
+    from truthweave.yaml_loader import load_yaml
+
+    static = tmp_path / "static.yml"
+    static.write_text("lr: 1e-3\nday: 2024-01-01\nitems: [a, 2]\nempty:\n")
+    interpolated = tmp_path / "interp.yml"
+    interpolated.write_text("name: demo\nmain: ${name}.tex\n")
+
+    for path in [static, interpolated]:
+        expected = OmegaConf.to_container(OmegaConf.load(path), resolve=True)
+        assert load_yaml(path) == expected
+
+
+def test_load_paper_config_validates_schema(tmp_path: Path) -> None:
+    path = tmp_path / "truthweave.yml"
+    path.write_text("paper_id: p1\npaths:\n  auto_dir: generated\nextra_key: 1\n")
+    cfg = load_paper_config(path)
+    assert cfg.paths["auto_dir"] == "generated"
+    assert cfg.paths["figures_dir"] == "figures"
+    assert cfg.to_dict()["extra_key"] == 1
+
+    path.write_text("paper_id: p1\nmain: [a]\nstyle: nope\n")
+    with pytest.raises(SystemExit, match="main must be a string; style must be"):
+        load_paper_config(path)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from truthweave import snapshot
+from truthweave.result_cache import HIT_RECORD, ResultCache
+from truthweave.runner import BaseExperiment
+
+
+def counting(calls: list[str]) -> Callable[[BaseExperiment], dict[str, Any]]:
+    def count(experiment: BaseExperiment) -> dict[str, Any]:
+        calls.append(experiment.run_dir.name)
+        (experiment.run_dir / "artifacts" / "out.txt").write_text("payload")
+        return {"value": 1.5}
+
+    return count
+
+
+def _fake_capture(cmd: list[str]) -> str:
+    if cmd[:2] == ["git", "rev-parse"]:
+        return "a" * 40
+    return ""
+
+
+def test_identical_run_reuses_cached_results(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_experiment: Callable[..., Path],
+) -> None:
+    monkeypatch.setattr(snapshot, "_run_capture", _fake_capture)
+    cache = ResultCache(tmp_path / "cache")
+    calls: list[str] = []
+
+    first = run_experiment(counting(calls), "first", result_cache=cache)
+    second = run_experiment(counting(calls), "second", result_cache=cache)
+
+    assert calls == ["first"]
+    assert json.loads((second / "metrics.json").read_text()) == {"value": 1.5}
+    assert (second / "artifacts" / "out.txt").read_text() == "payload"
+    assert not os.path.samefile(first / "metrics.json", second / "metrics.json")
+    assert not os.path.samefile(
+        first / "artifacts" / "out.txt", second / "artifacts" / "out.txt"
+    )
+    (second / "metrics.json").write_text("{}")
+    assert json.loads((first / "metrics.json").read_text()) == {"value": 1.5}
+    assert json.loads((second / HIT_RECORD).read_text())["source_run"] == "first"
+
+
+def test_dirty_tree_is_never_cached(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    run_experiment: Callable[..., Path],
+) -> None:
+    monkeypatch.setattr(
+        snapshot,
+        "_run_capture",
+        lambda cmd: "M file.py" if "status" in cmd else _fake_capture(cmd),
+    )
+    cache = ResultCache(tmp_path / "cache")
+    calls: list[str] = []
+
+    run_experiment(counting(calls), "first", result_cache=cache)
+    run_experiment(counting(calls), "second", result_cache=cache)
+
+    assert calls == ["first", "second"]
+
+
+def test_store_links_only_read_only_artifacts(tmp_path: Path) -> None:
+    run_dir = tmp_path / "runs" / "first"
+    (run_dir / "artifacts").mkdir(parents=True)
+    (run_dir / "metrics.json").write_text("{}")
+    (run_dir / "artifacts" / "out.txt").write_text("payload")
+    blob = run_dir / "artifacts" / "blob.bin"
+    blob.write_text("shared")
+    blob.chmod(0o444)
+
+    ResultCache(tmp_path / "cache").store("k", run_dir)
+
+    entry = tmp_path / "cache" / "k"
+    assert os.path.samefile(entry / "artifacts" / "blob.bin", blob)
+    assert not os.path.samefile(
+        entry / "artifacts" / "out.txt", run_dir / "artifacts" / "out.txt"
+    )
+    assert not os.path.samefile(entry / "metrics.json", run_dir / "metrics.json")
+
+
+def test_evict_drops_oldest_entries(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path / "cache", max_bytes=10)
+    for idx, name in enumerate(["old", "new"]):
+        entry = tmp_path / "cache" / name
+        entry.mkdir(parents=True)
+        (entry / "metrics.json").write_text("x" * 8)
+        os.utime(entry, (1000 + idx, 1000 + idx))
+
+    evicted = cache.evict()
+
+    assert [p.name for p in evicted] == ["old"]
+    assert (tmp_path / "cache" / "new").exists()
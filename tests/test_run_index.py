@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from truthweave import run_index
+from truthweave.utils import find_latest_run
+
+
+def _make_run(runs_dir: Path, name: str, mtime: float, experiment: str) -> Path:
+    run_dir = runs_dir / name
+    run_dir.mkdir(parents=True)
+    (run_dir / "config_resolved.yaml").write_text(
+        f"experiment:\n  name: {experiment}\n"
+    )
+    os.utime(run_dir, (mtime, mtime))
+    return run_dir
+
+
+def test_find_latest_run_uses_index(tmp_path: Path) -> None:
+    runs_dir = tmp_path / "runs"
+    old = _make_run(runs_dir, "old", 1000.0, "example")
+    new = _make_run(runs_dir, "new", 2000.0, "other")
+    run_index.record_run(old, "example")
+    run_index.record_run(new, "other")
+
+    assert run_index.default_index_path(runs_dir).exists()
+    assert find_latest_run(runs_dir) == new
+    assert run_index.latest_run(runs_dir, experiment="example") == old
+
+    for child in new.iterdir():
+        child.unlink()
+    new.rmdir()
+    assert find_latest_run(runs_dir) == old
+
+
+def test_find_latest_run_sees_unrecorded_runs(tmp_path: Path) -> None:
+    runs_dir = tmp_path / "runs"
+    old = _make_run(runs_dir, "old", 1000.0, "example")
+    run_index.record_run(old, "example")
+    new = _make_run(runs_dir, "new", 2000.0, "other")
+    os.utime(runs_dir, (2000.0, 2000.0))
+
+    assert find_latest_run(runs_dir) == new
+    assert run_index.latest_run(runs_dir, experiment="other") == new
+    assert run_index.backfill_index(runs_dir) == 0
+
+
+def test_find_latest_run_sees_runs_created_before_a_recorded_run(
+    tmp_path: Path,
+) -> None:
+    runs_dir = tmp_path / "runs"
+    old = _make_run(runs_dir, "old", 1000.0, "example")
+    run_index.record_run(old, "example")
+    find_latest_run(runs_dir)
+    crashed = _make_run(runs_dir, "crashed", 3000.0, "example")
+    running = _make_run(runs_dir, "running", 2000.0, "example")
+    os.utime(runs_dir, (1500.0, 1500.0))
+    run_index.record_run(running, "example")
+
+    assert find_latest_run(runs_dir) == crashed
+
+
+def test_rebuild_index_reads_runs_from_disk(tmp_path: Path) -> None:
+    runs_dir = tmp_path / "runs"
+    _make_run(runs_dir, "a", 1000.0, "example")
+    _make_run(runs_dir, "b", 3000.0, "example")
+    _make_run(runs_dir, "c", 2000.0, "other")
+
+    assert run_index.rebuild_index(runs_dir) == 3
+    by_exp = run_index.runs_by_experiment(runs_dir, "example")
+    assert [r.run_id for r in by_exp] == ["a", "b"]
+    window = run_index.runs_between(runs_dir, start=1500.0, end=2500.0)
+    assert [r.run_id for r in window] == ["c"]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from truthweave.checks import check_run_integrity
+from truthweave.cli import verify_runs_command
+from truthweave.run_manifest import RUN_MANIFEST, verify_run
+from truthweave.runner import BaseExperiment
+
+
+def write_preds(experiment: BaseExperiment) -> dict[str, Any]:
+    (experiment.run_dir / "artifacts" / "preds.txt").write_text("0 1 1 0\n")
+    return {"accuracy": 0.5}
+
+
+def test_runner_writes_verifiable_manifest(run_experiment: Callable[..., Path]) -> None:
+    run_dir = run_experiment(write_preds)
+
+    manifest = json.loads((run_dir / RUN_MANIFEST).read_text())
+    assert {"metrics.json", "artifacts/preds.txt"} <= set(manifest["files"])
+    assert verify_run(run_dir).problems == []
+
+    (run_dir / "artifacts" / "preds.txt").write_text("0 1 1 1\n")
+    (run_dir / "metrics.json").write_text("{}")
+    (run_dir / "artifacts" / "extra.bin").write_bytes(b"x")
+    assert verify_run(run_dir).problems == [
+        "modified artifacts/preds.txt",
+        f"size changed metrics.json ({manifest['files']['metrics.json']['size']} -> 2)",
+        "untracked artifacts/extra.bin",
+    ]
+
+
+def test_verify_runs_command_uses_process_pool(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    run_experiment: Callable[..., Path],
+) -> None:
+    monkeypatch.setenv("TRUTHWEAVE_REPO_ROOT", str(tmp_path))
+    for run_id in ["a", "b", "c"]:
+        run_experiment(write_preds, run_id)
+    (tmp_path / "runs" / "legacy").mkdir()
+
+    verify_runs_command(jobs=2)
+    out = capsys.readouterr().out
+    assert "Verified 4 runs" in out
+    assert "0 failed, 1 without RUN_MANIFEST.json" in out
+
+    (tmp_path / "runs" / "b" / "artifacts" / "preds.txt").unlink()
+    with pytest.raises(SystemExit):
+        verify_runs_command(jobs=2, rehash=True)
+    assert "[failed] b: missing artifacts/preds.txt" in capsys.readouterr().out
+
+
+def test_run_integrity_checks_pinned_runs(
+    tmp_path: Path, run_experiment: Callable[..., Path]
+) -> None:
+    pinned = run_experiment(write_preds, "pinned")
+    run_experiment(write_preds, "latest_run")
+    runs_dir = tmp_path / "runs"
+    assert check_run_integrity.check(runs_dir, "dev", pinned=["pinned"]) == []
+
+    (pinned / "metrics.json").write_text('{"accuracy": 0.9}')
+    issues = check_run_integrity.check(
+        runs_dir, "dev", pinned=["latest", "pinned", "gone"]
+    )
+    assert [issue.paths for issue in issues] == [
+        [str(runs_dir / "gone")],
+        [str(pinned / RUN_MANIFEST)],
+    ]
@@ -17,6 +17,7 @@ def test_create_analysis_creates_file(tmp_path: Path, monkeypatch: pytest.Monkey
     content = target.read_text()
     assert "def main()" in content
     assert "artifacts" in content
+    assert "run_arrays(Path(run_dir))" in content
 
 
 def test_create_dataset_creates_metadata(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from omegaconf import OmegaConf
+
+from truthweave import hardware, snapshot
+
+
+def test_env_freeze_is_cached_per_lock(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[list[str]] = []
+
+    def fake_capture(cmd: list[str]) -> str:
+        calls.append(cmd)
+        return "pkg==1.0"
+
+    monkeypatch.setattr(snapshot, "_run_capture", fake_capture)
+    lock = tmp_path / "uv.lock"
+    lock.write_text("lock v1")
+    cache_dir = snapshot.snapshot_cache_dir(tmp_path / "cache", lock)
+    assert cache_dir is not None
+
+    first = tmp_path / "run1"
+    second = tmp_path / "run2"
+    first.mkdir()
+    second.mkdir()
+    snapshot.save_env_freeze(first, cache_dir)
+    snapshot.save_env_freeze(second, cache_dir)
+
+    assert len(calls) == 1
+    assert (first / "env_freeze.txt").read_bytes() == (
+        second / "env_freeze.txt"
+    ).read_bytes()
+
+    lock.write_text("lock v2")
+    assert snapshot.snapshot_cache_dir(tmp_path / "cache", lock) != cache_dir
+
+
+def test_save_all_writes_every_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(snapshot, "_run_capture", lambda cmd: "")
+    cfg = OmegaConf.create({"runtime": {"seed": 1}})
+
+    snapshot.save_all(tmp_path, cfg, {"python": 1})
+
+    for name in [
+        "config_resolved.yaml",
+        "git_commit.txt",
+        "command.txt",
+        "env_freeze.txt",
+        "hardware.json",
+        "seeds.json",
+    ]:
+        assert (tmp_path / name).exists()
+
+
+def test_hardware_probes_follow_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cfg = OmegaConf.create(
+        {"logging": {"save_hardware_snapshot": {"probes": ["platform", "cuda"]}}}
+    )
+    probes = snapshot.hardware_probes(cfg)
+    assert probes == ["platform", "cuda"]
+
+    monkeypatch.setattr(hardware.importlib.util, "find_spec", lambda name: None)
+    snapshot.save_hardware_info(tmp_path, probes=probes)
+
+    info = json.loads((tmp_path / "hardware.json").read_text())
+    assert info["cuda_version"] is None
+    assert "cpu_count_logical" not in info
+    assert set(info["probe_seconds"]) == {"platform", "cuda"}
+
+
+def test_cli_snapshot_cache_dir_follows_uv_lock(tmp_path: Path) -> None:
+    from truthweave.cli import _snapshot_cache_dir
+
+    assert _snapshot_cache_dir(tmp_path) is None
+    (tmp_path / "uv.lock").write_text("lock v1")
+    cache_dir = _snapshot_cache_dir(tmp_path)
+    assert cache_dir is not None
+    assert cache_dir.parent == tmp_path / "artifacts" / "cache" / "snapshots"
+
+
+def test_run_command_end_to_end(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import shutil
+
+    from truthweave.cli import run_command
+
+    shutil.copytree(Path(__file__).resolve().parents[1] / "conf", tmp_path / "conf")
+    (tmp_path / "uv.lock").write_text("lock v1")
+    monkeypatch.setenv("TRUTHWEAVE_REPO_ROOT", str(tmp_path))
+    monkeypatch.setattr(snapshot, "_run_capture", lambda cmd: "")
+
+    run_command(["exp=example", "example.n=10", "experiment.output_subdir=e2e"])
+
+    run_dir = tmp_path / "runs" / "e2e"
+    assert json.loads((run_dir / "metrics.json").read_text())["n"] == 10
+    assert (run_dir / "env_freeze.txt").exists()
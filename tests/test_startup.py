@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+IMPORT_BUDGET_MS = float(os.environ.get("TRUTHWEAVE_IMPORT_BUDGET_MS", "250"))
+HEAVY_MODULES = ["hydra", "omegaconf", "psutil"]
+
+
+def _python(code: str, *args: str, env: dict[str, str] | None = None) -> str:
+    merged = {**os.environ, "PYTHONPATH": str(SRC_DIR), **(env or {})}
+    result = subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        env=merged,
+        check=True,
+    )
+    return result.stdout + result.stderr
+
+
+def _cumulative_us(importtime_output: str, module: str) -> int:
+    for line in importtime_output.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} missing from -X importtime output")
+
+
+def test_cli_import_within_budget() -> None:
+    # Best of three runs to keep the budget stable on a noisy machine.
+    runs = [_python("import truthweave.cli", "-X", "importtime") for _ in range(3)]
+    best = min(_cumulative_us(output, "truthweave.cli") for output in runs)
+    assert best / 1000 < IMPORT_BUDGET_MS
+
+
+@pytest.mark.parametrize("command", ["discover", "check-structure"])
+def test_light_commands_skip_heavy_imports(tmp_path: Path, command: str) -> None:
+    (tmp_path / "papers").mkdir()
+    code = (
+        "import sys\n"
+        "from truthweave.cli import main\n"
+        f"sys.argv = ['truthweave', '{command}']\n"
+        "main()\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    output = _python(code, env={"TRUTHWEAVE_REPO_ROOT": str(tmp_path)})
+    assert output.strip().splitlines()[-1] == "[]"
+
+
+def test_entry_point_defers_cli_import() -> None:
+    code = (
+        "import sys\n"
+        "import truthweave.entry\n"
+        "print(sorted(m for m in sys.modules if m.startswith('truthweave.')))\n"
+    )
+    output = _python(code)
+    loaded = output.strip().splitlines()[-1]
+    assert loaded == "['truthweave.daemon', 'truthweave.entry']"
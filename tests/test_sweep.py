@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from truthweave import snapshot
+from truthweave.compose import expand_sweep
+from truthweave.sweep import run_sweep
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_expand_sweep_is_cartesian_product() -> None:
+    sets = expand_sweep(["exp=example", "example.n=1,2", "runtime.seed=3,4"])
+    assert len(sets) == 4
+    assert ["exp=example", "example.n=1", "runtime.seed=3"] in sets
+    assert ["exp=example", "example.n=2", "runtime.seed=4"] in sets
+
+
+def test_sweep_links_shared_snapshots(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    shutil.copytree(REPO_ROOT / "conf", tmp_path / "conf")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(snapshot, "_run_capture", lambda cmd: "")
+
+    results = run_sweep(tmp_path, ["exp=example", "example.n=5,6"], max_workers=1)
+
+    assert [error for _, error in results] == [None, None]
+    first, second = (job.run_dir for job, _ in results)
+    assert first != second
+    for name in snapshot.SHARED_SNAPSHOTS:
+        assert os.path.samefile(first / name, second / name)
+    assert (first / "metrics.json").exists()